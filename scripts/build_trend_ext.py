@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time compile the trend regression kernel with numba.pycc.
+
+Even with cache=True, the first call per process pays LLVM codegen; for
+short-lived CLI runs that cost dominates. This script builds a
+_trend_ext extension module next to trend_detector.py, which then
+imports it instead of JIT-compiling. Rerun after changing the kernel.
+"""
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+PACKAGE_DIR = PROJECT_ROOT / "src" / "unemployment_tracker"
+sys.path.insert(0, str(PACKAGE_DIR))
+
+
+def main():
+    try:
+        from numba.pycc import CC
+    except ImportError:
+        print("Error: numba (with pycc support) is required for the AOT build")
+        return 1
+
+    from processing.trend_detector import _trend_kernel_py
+
+    cc = CC('_trend_ext')
+    cc.output_dir = str(PACKAGE_DIR / "processing")
+    cc.export('trend_kernel', 'Tuple((f8, f8, f8, f8, f8))(f8[:])')(_trend_kernel_py)
+    cc.compile()
+    print(f"Built _trend_ext in {cc.output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
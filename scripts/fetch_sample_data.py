@@ -5,15 +5,19 @@ This script generates sample data files in the data/raw directory.
 """
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-import random
 
 # Project root directory
 PROJECT_ROOT = Path(__file__).parent.parent.absolute()
 DATA_DIR = PROJECT_ROOT / "data" / "raw"
 
+# Shared random generator; set SAMPLE_SEED for reproducible output (e.g. in CI)
+RNG = np.random.default_rng(int(os.environ.get('SAMPLE_SEED', '0')) or None)
+
 def create_sample_unemployment_data() -> pd.DataFrame:
     """Create sample unemployment data."""
     # Generate sample data for the past 24 months
@@ -21,34 +25,34 @@ def create_sample_unemployment_data() -> pd.DataFrame:
     start_date = end_date - timedelta(days=30*24)  # ~2 years
     
     dates = pd.date_range(start=start_date, end=end_date, freq='M')
-    
+    n_dates = len(dates)
+
     # Create sample data for different demographics
-    data = []
     demographics = ['total', 'black', 'hispanic', 'white', 'asian', 'men_20_plus', 'women_20_plus']
-    
-    for date in dates:
-        base_rate = random.uniform(3.0, 6.0)  # Base unemployment rate between 3% and 6%
-        
-        for demo in demographics:
-            # Add some variation based on demographic
-            if demo == 'black':
-                rate = base_rate * random.uniform(1.5, 2.5)  # Higher for black population
-            elif demo == 'hispanic':
-                rate = base_rate * random.uniform(1.2, 1.8)  # Higher for hispanic population
-            elif demo == 'women_20_plus':
-                rate = base_rate * random.uniform(0.9, 1.1)  # Slightly different for women
-            elif demo == 'men_20_plus':
-                rate = base_rate * random.uniform(0.9, 1.1)  # Slightly different for men
-            else:
-                rate = base_rate * random.uniform(0.8, 1.2)  # Some random variation
-            
-            data.append({
-                'date': date.strftime('%Y-%m-%d'),
-                'demographic': demo,
-                'value': round(rate, 1)
-            })
-    
-    return pd.DataFrame(data)
+
+    # Per-demographic multiplier ranges (higher for black/hispanic populations,
+    # slight variation for men/women, some random variation for the rest)
+    low = np.array([0.8, 1.5, 1.2, 0.8, 0.8, 0.9, 0.9])
+    high = np.array([1.2, 2.5, 1.8, 1.2, 1.2, 1.1, 1.1])
+
+    # Base unemployment rate between 3% and 6%, varied per demographic,
+    # drawn as a single (n_dates, n_demographics) matrix
+    base = RNG.uniform(3.0, 6.0, size=n_dates)[:, None]
+    mult = RNG.uniform(low, high, size=(n_dates, len(demographics)))
+    rates = np.round(base * mult, 1)
+
+    # Keep dates as datetime64 so Parquet stores native timestamps and
+    # downstream readers skip date parsing entirely
+    df = pd.DataFrame({
+        'date': np.repeat(dates, len(demographics)),
+        'demographic': np.tile(demographics, n_dates),
+        'value': rates.ravel().astype(np.float32)  # rates fit comfortably in float32
+    })
+
+    # Store demographic as a categorical so Parquet writes it as a dictionary column
+    df['demographic'] = pd.Categorical(df['demographic'], categories=demographics)
+
+    return df
 
 def create_sample_layoff_data() -> pd.DataFrame:
     """Create sample layoff data.
@@ -56,45 +60,48 @@ def create_sample_layoff_data() -> pd.DataFrame:
     Note: This is a simplified version with mock data.
     In a real application, you would fetch this from a reliable source.
     """
-    # Sample companies and industries
-    companies = [
-        {'name': 'TechCorp', 'industry': 'Technology', 'employees': 10000},
-        {'name': 'DataSystems', 'industry': 'Technology', 'employees': 5000},
-        {'name': 'CloudNine', 'industry': 'Technology', 'employees': 8000},
-        {'name': 'RetailGiant', 'industry': 'Retail', 'employees': 50000},
-        {'name': 'ShopEasy', 'industry': 'Retail', 'employees': 30000},
-        {'name': 'AutoMakers', 'industry': 'Automotive', 'employees': 40000},
-        {'name': 'EcoEnergy', 'industry': 'Energy', 'employees': 15000},
-        {'name': 'HealthPlus', 'industry': 'Healthcare', 'employees': 20000},
-        {'name': 'FinancePro', 'industry': 'Finance', 'employees': 12000},
-        {'name': 'MediaNet', 'industry': 'Media', 'employees': 7000},
-    ]
-    
-    # Generate layoff events
-    layoffs = []
+    # Sample companies and industries as parallel column arrays,
+    # ready for vectorized indexing
+    names = np.array(['TechCorp', 'DataSystems', 'CloudNine', 'RetailGiant', 'ShopEasy',
+                      'AutoMakers', 'EcoEnergy', 'HealthPlus', 'FinancePro', 'MediaNet'])
+    industries = np.array(['Technology', 'Technology', 'Technology', 'Retail', 'Retail',
+                           'Automotive', 'Energy', 'Healthcare', 'Finance', 'Media'])
+    employees = np.array([10000, 5000, 8000, 50000, 30000,
+                          40000, 15000, 20000, 12000, 7000], dtype=np.int32)
+
+    # Precomputed "City, ST" lookup table (8x8 outer product); a single
+    # integer draw per row replaces two random.choice calls + an f-string
+    cities = ['San Francisco', 'New York', 'Austin', 'Seattle', 'Boston', 'Chicago', 'Denver', 'Atlanta']
+    states = ['CA', 'NY', 'TX', 'WA', 'MA', 'IL', 'CO', 'GA']
+    location_table = np.array([f"{city}, {state}" for city in cities for state in states])
+
+    # Generate 50 layoff events with all random draws done in bulk
+    n_events = 50
     end_date = datetime.now()
-    
-    for i in range(50):  # Generate 50 layoff events
-        company = random.choice(companies)
-        layoff_date = end_date - timedelta(days=random.randint(1, 365))  # Random date in the past year
-        
-        # Generate a layoff size (1-20% of company size)
-        layoff_percent = random.uniform(0.01, 0.20)
-        layoff_count = max(10, int(company['employees'] * layoff_percent))
-        
-        layoffs.append({
-            'company': company['name'],
-            'industry': company['industry'],
-            'date_announced': layoff_date.strftime('%Y-%m-%d'),
-            'employees_laid_off': layoff_count,
-            'total_employees': company['employees'],
-            'percentage_laid_off': round(layoff_percent * 100, 1),
-            'location': f"{random.choice(['San Francisco', 'New York', 'Austin', 'Seattle', 'Boston', 'Chicago', 'Denver', 'Atlanta'])}, {random.choice(['CA', 'NY', 'TX', 'WA', 'MA', 'IL', 'CO', 'GA'])}",
-            'source': 'sample_data',
-            'notes': 'Sample data for demonstration purposes'
-        })
-    
-    return pd.DataFrame(layoffs)
+
+    company_idx = RNG.integers(0, len(names), size=n_events)
+    day_offsets = RNG.integers(1, 366, size=n_events)  # Random date in the past year
+    layoff_percents = RNG.uniform(0.01, 0.20, size=n_events)  # 1-20% of company size
+
+    total_employees = employees[company_idx]
+    layoff_counts = np.maximum(10, (total_employees * layoff_percents).astype(int))
+    layoff_dates = (np.datetime64(end_date.date()) - day_offsets.astype('timedelta64[D]')).astype('datetime64[ns]')
+
+    locations = location_table[RNG.integers(0, len(location_table), size=n_events)]
+
+    # Downcast the numeric columns: employee counts and percentages have
+    # small ranges, so int32/float32 halve the bytes written and re-read
+    return pd.DataFrame({
+        'company': names[company_idx],
+        'industry': industries[company_idx],
+        'date_announced': layoff_dates,
+        'employees_laid_off': layoff_counts.astype(np.int32),
+        'total_employees': total_employees.astype(np.int32),
+        'percentage_laid_off': np.round(layoff_percents * 100, 1).astype(np.float32),
+        'location': locations,
+        'source': 'sample_data',
+        'notes': 'Sample data for demonstration purposes'
+    })
 
 def generate_sample_data() -> bool:
     """Generate sample data files."""
@@ -102,20 +109,36 @@ def generate_sample_data() -> bool:
         # Create data directory if it doesn't exist
         os.makedirs(DATA_DIR, exist_ok=True)
         
-        # Generate sample unemployment data
+        # Generate both frames on the main thread (they share RNG)
         print("Generating sample unemployment data...")
         unemployment_df = create_sample_unemployment_data()
-        unemployment_file = DATA_DIR / "sample_unemployment.csv"
-        unemployment_df.to_csv(unemployment_file, index=False)
-        print(f"Saved sample unemployment data to {unemployment_file}")
-        
-        # Generate sample layoff data
+        unemployment_file = DATA_DIR / "sample_unemployment.parquet"
+
         print("Generating sample layoff data...")
         layoff_df = create_sample_layoff_data()
-        layoff_file = DATA_DIR / "sample_layoffs.csv"
-        layoff_df.to_csv(layoff_file, index=False)
+        layoff_file = DATA_DIR / "sample_layoffs.parquet"
+
+        # pyarrow releases the GIL during the Snappy-compressed writes, so
+        # the two independent outputs overlap disk IO and compression
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(
+                    unemployment_df.to_parquet, unemployment_file,
+                    engine='pyarrow', compression='snappy',
+                    row_group_size=max(len(unemployment_df), 1), index=False
+                ),
+                executor.submit(
+                    layoff_df.to_parquet, layoff_file,
+                    engine='pyarrow', compression='snappy',
+                    row_group_size=max(len(layoff_df), 1), index=False
+                )
+            ]
+            for future in futures:
+                future.result()
+
+        print(f"Saved sample unemployment data to {unemployment_file}")
         print(f"Saved sample layoff data to {layoff_file}")
-        
+
         return True
     
     except Exception as e:
@@ -11,28 +11,28 @@ from pathlib import Path
 
 # Project metadata
 PROJECT_NAME = "unemployment-tracker"
-PYTHON_VERSION = "3.8"
+MIN_PY = (3, 8)
 REQUIREMENTS_FILE = "requirements.txt"
 ENV_EXAMPLE_FILE = ".env.example"
 ENV_FILE = ".env"
 
 def run_command(command, cwd=None):
-    """Run a shell command and return True if successful."""
+    """Run a shell command and return True if successful.
+
+    The child inherits stdout/stderr so output streams directly to the
+    terminal; capturing pip's (potentially huge) output in a pipe buffers
+    it all in memory and can deadlock when the pipe fills.
+    """
     try:
         print(f"Running: {' '.join(command)}")
-        result = subprocess.run(
+        subprocess.run(
             command,
             cwd=cwd or os.getcwd(),
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+            check=True
         )
-        if result.stdout:
-            print(result.stdout)
         return True
     except subprocess.CalledProcessError as e:
-        print(f"Error: {e.stderr}" if e.stderr else f"Command failed with code {e.returncode}")
+        print(f"Command failed with code {e.returncode}")
         return False
     except Exception as e:
         print(f"Unexpected error: {str(e)}")
@@ -40,15 +40,10 @@ def run_command(command, cwd=None):
 
 def check_python_version():
     """Check if the Python version meets the requirements."""
-    try:
-        major, minor = map(int, PYTHON_VERSION.split('.'))
-        if sys.version_info < (major, minor):
-            print(f"Error: Python {major}.{minor}+ is required. Current version: {sys.version_info.major}.{sys.version_info.minor}")
-            return False
-        return True
-    except Exception as e:
-        print(f"Error checking Python version: {str(e)}")
+    if sys.version_info[:2] < MIN_PY:
+        print(f"Error: Python {MIN_PY[0]}.{MIN_PY[1]}+ is required. Current version: {sys.version_info.major}.{sys.version_info.minor}")
         return False
+    return True
 
 def create_virtual_environment():
     """Create a Python virtual environment."""
@@ -70,16 +65,22 @@ def install_dependencies():
     pip_cmd = os.path.join(".venv", "bin", "pip")
     if sys.platform == "win32":
         pip_cmd = os.path.join(".venv", "Scripts", "pip")
-    
-    # Install the package in development mode
-    if not run_command([pip_cmd, "install", "-e", "."]):
+
+    # Skip pip's PyPI version-advisory network call
+    os.environ["PIP_DISABLE_PIP_VERSION_CHECK"] = "1"
+
+    # Install the package in development mode without resolving dependencies;
+    # they're resolved once in the combined install below
+    if not run_command([pip_cmd, "install", "--no-deps", "-e", "."]):
         return False
-    
-    # Install development dependencies
+
+    # Resolve all dependencies in a single pass, preferring wheels over sdists
+    install_cmd = [pip_cmd, "install", "--prefer-binary", "-r", REQUIREMENTS_FILE]
     if os.path.exists("requirements-dev.txt"):
-        if not run_command([pip_cmd, "install", "-r", "requirements-dev.txt"]):
-            return False
-    
+        install_cmd += ["-r", "requirements-dev.txt"]
+    if not run_command(install_cmd):
+        return False
+
     print("Dependencies installed successfully!")
     return True
 
@@ -102,6 +103,16 @@ def setup_environment_vars():
         print(f"Error creating {ENV_FILE}: {str(e)}")
         return False
 
+# Directories already created in this process; saves repeat stat/mkdir syscalls
+_ensured_dirs = set()
+
+def ensure_directory(path):
+    """Create the directory once per process; later calls are a set lookup."""
+    path = Path(path)
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
 def create_data_directories():
     """Create necessary data directories."""
     directories = [
@@ -110,10 +121,10 @@ def create_data_directories():
         "data/external",
         "logs"
     ]
-    
+
     try:
         for directory in directories:
-            os.makedirs(directory, exist_ok=True)
+            ensure_directory(directory)
             print(f"Created directory: {directory}")
         return True
     except Exception as e:
@@ -4,6 +4,7 @@ Setup script for the Unemployment Tracker application with sample data.
 This script sets up the environment, generates sample data, and processes it.
 """
 import os
+import shutil
 import sys
 import subprocess
 from pathlib import Path
@@ -97,25 +98,60 @@ def setup_environment() -> bool:
         print_error(f"Failed to install dependencies: {e.stderr}")
         return False
 
-def generate_sample_data() -> bool:
-    """Generate sample data."""
-    print_header("Generating Sample Data")
-    return run_script("fetch_sample_data.py")
+def generate_and_process_sample_data() -> bool:
+    """Generate and process sample data as one in-memory pipeline.
 
-def process_sample_data() -> bool:
-    """Process the sample data."""
-    print_header("Processing Sample Data")
-    return run_script("process_sample_data.py")
+    Keeps the DataFrames in RAM between the generate and process steps so the
+    data doesn't round-trip through disk; only the processed Parquet files
+    are written. The scripts remain usable standalone.
+    """
+    print_header("Generating and Processing Sample Data")
+
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    try:
+        from fetch_sample_data import (
+            create_sample_unemployment_data,
+            create_sample_layoff_data,
+        )
+        from process_sample_data import (
+            process_unemployment_df,
+            process_layoff_df,
+            DATA_PROCESSED,
+        )
+    except ImportError as e:
+        print_error(f"Could not import sample data helpers: {str(e)}")
+        return False
+
+    try:
+        os.makedirs(DATA_PROCESSED, exist_ok=True)
+
+        print("Generating sample unemployment data...")
+        unemployment_df = process_unemployment_df(create_sample_unemployment_data())
+        unemployment_file = DATA_PROCESSED / "bls_unemployment.parquet"
+        unemployment_df.to_parquet(unemployment_file, engine='pyarrow', compression='snappy',
+                                   row_group_size=max(len(unemployment_df), 1), index=False)
+        print_success(f"Saved processed unemployment data to {unemployment_file}")
+
+        print("Generating sample layoff data...")
+        layoff_df = process_layoff_df(create_sample_layoff_data())
+        layoff_file = DATA_PROCESSED / "processed_layoffs.parquet"
+        layoff_df.to_parquet(layoff_file, engine='pyarrow', compression='snappy',
+                             row_group_size=max(len(layoff_df), 1), index=False)
+        print_success(f"Saved processed layoff data to {layoff_file}")
+
+        return True
+    except Exception as e:
+        print_error(f"Error generating sample data: {str(e)}")
+        return False
 
 def run_application() -> bool:
     """Run the Streamlit application."""
     print_header("Starting Unemployment Tracker")
     
-    # Check if Streamlit is installed
-    try:
-        import streamlit
+    # Check if Streamlit is installed (which avoids importing the package)
+    if shutil.which("streamlit"):
         print_success("Streamlit is installed")
-    except ImportError:
+    else:
         print_error("Streamlit is not installed. Please install it with: pip install streamlit")
         return False
     
@@ -143,8 +179,7 @@ def main() -> int:
     # Run setup steps
     steps = [
         ("Environment Setup", setup_environment),
-        ("Sample Data Generation", generate_sample_data),
-        ("Data Processing", process_sample_data),
+        ("Sample Data Generation", generate_and_process_sample_data),
         ("Application Launch", run_application)
     ]
     
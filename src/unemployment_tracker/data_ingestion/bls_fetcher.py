@@ -1,22 +1,64 @@
 import os
 import json
+import hashlib
 import requests
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson decodes large API responses several times faster than stdlib json;
+# fall back gracefully when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Load environment variables
 load_dotenv()
 
 class BLSDataFetcher:
     """Class to fetch and process unemployment data from BLS API."""
-    
-    def __init__(self, api_key=None):
-        """Initialize with optional API key."""
+
+    # BLS API v2 per-request limits
+    MAX_SERIES_PER_REQUEST = 50
+    MAX_YEARS_PER_REQUEST = 20
+
+
+    def __init__(self, api_key=None, cache_dir=None, cache_ttl=6 * 3600):
+        """Initialize with optional API key.
+
+        Args:
+            api_key (str, optional): BLS API key (default: BLS_API_KEY env var)
+            cache_dir (str, optional): Directory for the on-disk response cache
+            cache_ttl (int): Cache lifetime in seconds for windows that touch
+                the current (still-changing) year; closed years never expire
+        """
         self.api_key = api_key or os.getenv('BLS_API_KEY')
+        self.cache_dir = Path(cache_dir) if cache_dir else (
+            Path.home() / '.cache' / 'unemployment_tracker' / 'bls'
+        )
+        self.cache_ttl = cache_ttl
         self.base_url = 'https://api.bls.gov/publicAPI/v2/timeseries/data/'
         self.headers = {'Content-type': 'application/json'}
-        
+
+        # Persistent session: keep-alive amortizes the TLS handshake across
+        # calls, and the adapter retries transient server/rate-limit errors
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        ))
+
+
         # Common series IDs for unemployment data
         self.series_ids = {
             'total': 'LNS14000000',  # Total unemployment
@@ -49,55 +91,164 @@ class BLSDataFetcher:
         current_year = datetime.now().year
         start_year = start_year or (current_year - 5)
         end_year = end_year or current_year
-        
-        # Prepare API request payload
+
+        # Split the request along the API's 50-series / 20-year per-call
+        # limits; oversized requests used to fail or come back truncated
+        series_chunks = [
+            series_ids[i:i + self.MAX_SERIES_PER_REQUEST]
+            for i in range(0, len(series_ids), self.MAX_SERIES_PER_REQUEST)
+        ]
+        year_windows = [
+            (year, min(year + self.MAX_YEARS_PER_REQUEST - 1, end_year))
+            for year in range(start_year, end_year + 1, self.MAX_YEARS_PER_REQUEST)
+        ]
+        windows = [(chunk, first, last)
+                   for chunk in series_chunks
+                   for first, last in year_windows]
+
+        if len(windows) == 1:
+            return self._fetch_window(*windows[0])
+
+        # Independent windows share the session's connection pool, so a few
+        # worker threads overlap their network waits
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            frames = list(executor.map(lambda w: self._fetch_window(*w), windows))
+
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame()
+
+        df = pd.concat(frames, ignore_index=True)
+        df['demographic'] = df['demographic'].astype('category')
+        return df.sort_values('date', kind='mergesort')
+
+    def _fetch_window(self, series_ids, start_year, end_year):
+        """Fetch and process one cache-aware API request within the limits."""
         data = {
             "seriesid": series_ids,
             "startyear": str(start_year),
             "endyear": str(end_year),
             "registrationkey": self.api_key
         }
-        
+
+        # Past data is immutable, so a cached response skips HTTP entirely
+        cache_path = self._cache_path(data)
+        cached = self._read_cache(cache_path, end_year)
+        if cached is not None:
+            return self._process_response(cached)
+
         try:
-            response = requests.post(
+            # Encode the payload ourselves and decode straight from the raw
+            # bytes so the C-native parser handles both directions
+            body = orjson.dumps(data) if orjson else json.dumps(data).encode()
+            response = self.session.post(
                 self.base_url,
                 headers=self.headers,
-                data=json.dumps(data)
+                data=body,
+                timeout=30
             )
             response.raise_for_status()
-            json_data = response.json()
-            
+            json_data = orjson.loads(response.content) if orjson else response.json()
+
             if json_data.get('status') != 'REQUEST_SUCCEEDED':
                 raise Exception(f"BLS API error: {json_data.get('message', 'Unknown error')}")
-                
+
+            self._write_cache(cache_path, json_data)
             return self._process_response(json_data)
-            
+
         except requests.exceptions.RequestException as e:
             print(f"Error fetching data from BLS API: {e}")
             return pd.DataFrame()
-    
+
+    def _cache_path(self, payload):
+        """Content-addressed cache path for a request payload."""
+        key = hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _read_cache(self, path, end_year):
+        """Return a cached API response, or None if absent or stale.
+
+        Fully-closed years never change, so those entries live forever;
+        windows touching the current year expire after cache_ttl seconds.
+        """
+        try:
+            with open(path) as fh:
+                envelope = json.load(fh)
+        except (OSError, ValueError):
+            return None
+
+        if end_year >= datetime.now().year:
+            try:
+                fetched_at = datetime.fromisoformat(envelope['fetched_at'])
+            except (KeyError, ValueError):
+                return None
+            if (datetime.now() - fetched_at).total_seconds() > self.cache_ttl:
+                return None
+
+        return envelope.get('response')
+
+    def _write_cache(self, path, json_data):
+        """Atomically persist an API response (best effort)."""
+        envelope = {'fetched_at': datetime.now().isoformat(), 'response': json_data}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as fh:
+                json.dump(envelope, fh)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: could not write BLS cache entry: {e}")
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _process_response(self, json_data):
         """Process the JSON response from BLS API into a pandas DataFrame."""
-        records = []
-        
+        id_to_demographic = {v: k for k, v in self.series_ids.items()}
+
+        # One frame per series, built straight from the list of dicts; the
+        # per-row parsing below is then done in vectorized pandas kernels
+        frames = []
         for series in json_data.get('Results', {}).get('series', []):
-            series_id = series.get('seriesID')
-            demographic = next((k for k, v in self.series_ids.items() if v == series_id), 'unknown')
-            
-            for data_point in series.get('data', []):
-                records.append({
-                    'date': f"{data_point['year']}-{data_point['period'][1:]}-01",
-                    'demographic': demographic,
-                    'value': float(data_point['value']),
-                    'footnotes': data_point.get('footnotes', [{}])[0].get('text', '')
-                })
-        
-        df = pd.DataFrame(records)
-        if not df.empty:
-            df['date'] = pd.to_datetime(df['date'])
-            df = df.sort_values('date')
-            
-        return df
+            data_points = series.get('data', [])
+            if not data_points:
+                continue
+            series_df = pd.DataFrame(data_points, columns=['year', 'period', 'value', 'footnotes'])
+            series_df['demographic'] = id_to_demographic.get(series.get('seriesID'), 'unknown')
+            frames.append(series_df)
+
+        if not frames:
+            return pd.DataFrame()
+
+        df = pd.concat(frames, ignore_index=True)
+
+        # Vectorized date assembly, numeric cast, and footnote extraction;
+        # dates come straight from the numeric year/month parts, skipping
+        # string formatting and parsing entirely
+        df['date'] = pd.to_datetime({
+            'year': df['year'].astype('int32'),
+            'month': df['period'].str[1:].astype('int32'),
+            'day': 1
+        })
+        df['value'] = df['value'].astype('float32')
+        df['footnotes'] = [
+            footnotes[0].get('text', '') if isinstance(footnotes, list) and footnotes else ''
+            for footnotes in df['footnotes']
+        ]
+
+        # Seven distinct demographics: categorical stores int codes plus a
+        # small label table, so downstream groupby/filtering works on codes
+        df['demographic'] = df['demographic'].astype('category')
+
+        # mergesort is stable and cheap on the already-ordered series data
+        return df[['date', 'demographic', 'value', 'footnotes']].sort_values('date', kind='mergesort')
     
     def save_to_csv(self, df, filename='bls_unemployment.csv'):
         """Save the DataFrame to a CSV file."""
@@ -1,8 +1,12 @@
 from geopy.geocoders import Nominatim, GoogleV3
 from geopy.extra.rate_limiter import RateLimiter
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
+import asyncio
+import json
+import sqlite3
 import pandas as pd
 import time
+from pathlib import Path
 from typing import Optional, Tuple, Dict, Any
 from dataclasses import dataclass
 
@@ -14,31 +18,106 @@ class GeoPoint:
     address: Optional[Dict[str, Any]] = None
     raw: Optional[Any] = None
 
+class GeoCache:
+    """SQLite-backed cache of geocoding results keyed by normalized address.
+
+    Successful resolutions never expire (places don't move); cached failures
+    are retried after a week. Shared by GeoCoder and LayoffDataParser so
+    repeat pipeline runs skip the rate-limited API for known locations.
+    """
+
+    NULL_TTL_SECONDS = 7 * 24 * 3600
+
+    def __init__(self, path: Optional[str] = None):
+        """Open (creating if needed) the cache database.
+
+        Args:
+            path: Database file path (default: ~/.cache/unemployment_tracker/geo.sqlite)
+        """
+        if path is None:
+            cache_dir = Path.home() / '.cache' / 'unemployment_tracker'
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            path = str(cache_dir / 'geo.sqlite')
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS geo("
+            "addr TEXT PRIMARY KEY, lat REAL, lon REAL, raw TEXT, ts INTEGER)"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def normalize(address: str) -> str:
+        """Normalize an address for use as a cache key."""
+        return ' '.join(str(address).lower().split())
+
+    def get(self, address: str) -> Tuple[bool, Optional[GeoPoint]]:
+        """Look up an address in the cache.
+
+        Returns:
+            (hit, point): hit is True when a usable entry exists; point is
+            None for a cached failed lookup that hasn't expired yet.
+        """
+        row = self.conn.execute(
+            "SELECT lat, lon, raw, ts FROM geo WHERE addr=?",
+            (self.normalize(address),)
+        ).fetchone()
+        if row is None:
+            return False, None
+
+        lat, lon, raw, ts = row
+        if lat is None:
+            if time.time() - ts > self.NULL_TTL_SECONDS:
+                return False, None
+            return True, None
+
+        raw_data = json.loads(raw) if raw else None
+        return True, GeoPoint(
+            latitude=lat,
+            longitude=lon,
+            address=(raw_data or {}).get('address', {}),
+            raw=raw_data
+        )
+
+    def put(self, address: str, point: Optional[GeoPoint]) -> None:
+        """Store a geocoding result (or a failed lookup) for an address."""
+        if point is None:
+            values = (self.normalize(address), None, None, None, int(time.time()))
+        else:
+            raw = json.dumps(point.raw) if point.raw is not None else None
+            values = (self.normalize(address), point.latitude, point.longitude, raw, int(time.time()))
+        self.conn.execute("INSERT OR REPLACE INTO geo VALUES (?, ?, ?, ?, ?)", values)
+        self.conn.commit()
+
 class GeoCoder:
     """A utility class for geocoding operations with rate limiting and retry logic."""
     
-    def __init__(self, provider: str = 'nominatim', api_key: str = None, **kwargs):
+    def __init__(self, provider: str = 'nominatim', api_key: str = None,
+                 cache: Optional[GeoCache] = None, **kwargs):
         """Initialize the geocoder with the specified provider.
-        
+
         Args:
             provider: Geocoding service to use ('nominatim' or 'google')
             api_key: API key for the geocoding service (required for Google)
+            cache: Persistent result cache (default: a GeoCache at the
+                standard location, shared with other geocoding users)
             **kwargs: Additional arguments to pass to the geocoder
         """
         self.provider = provider.lower()
         self.api_key = api_key
+        self.cache = cache or GeoCache()
         self.kwargs = kwargs
         self._init_geocoder()
         
     def _init_geocoder(self):
         """Initialize the appropriate geocoder based on the provider."""
+        self.user_agent = self.kwargs.pop('user_agent', 'unemployment_tracker')
         if self.provider == 'google':
             if not self.api_key:
                 raise ValueError("API key is required for Google Geocoding API")
             self.geocoder = GoogleV3(api_key=self.api_key, **self.kwargs)
         else:  # Default to Nominatim
-            user_agent = self.kwargs.pop('user_agent', 'unemployment_tracker')
-            self.geocoder = Nominatim(user_agent=user_agent, **self.kwargs)
+            self.geocoder = Nominatim(user_agent=self.user_agent, **self.kwargs)
         
         # Set up rate limiting (1 request per second by default)
         min_delay = 1.1  # Slightly more than 1 second to be safe
@@ -51,21 +130,31 @@ class GeoCoder:
     
     def _geocode_with_retry(self, query: str, **kwargs) -> Optional[GeoPoint]:
         """Internal method with retry logic for geocoding."""
+        # Answer repeat queries from the persistent cache before going online
+        hit, cached = self.cache.get(query)
+        if hit:
+            return cached
+
         max_retries = 3
         retry_delay = 2  # seconds
-        
+
         for attempt in range(max_retries):
             try:
                 location = self.geocoder.geocode(query, **kwargs)
                 if location:
-                    return GeoPoint(
+                    point = GeoPoint(
                         latitude=location.latitude,
                         longitude=location.longitude,
                         address=location.raw.get('address', {}) if hasattr(location, 'raw') else {},
                         raw=location.raw if hasattr(location, 'raw') else None
                     )
+                    self.cache.put(query, point)
+                    return point
+                # Remember the miss too, so unknown addresses aren't retried
+                # on every run (they expire after NULL_TTL_SECONDS)
+                self.cache.put(query, None)
                 return None
-                    
+
             except (GeocoderTimedOut, GeocoderServiceError) as e:
                 if attempt == max_retries - 1:
                     print(f"Geocoding failed after {max_retries} attempts: {e}")
@@ -75,7 +164,96 @@ class GeoCoder:
                 print(f"Unexpected error during geocoding: {e}")
                 return None
     
-    def geocode_dataframe(self, 
+    def geocode_many(self, addresses: list) -> Dict[str, GeoPoint]:
+        """Geocode many addresses concurrently via the async adapter.
+
+        Overlaps the network waits of independent requests; Nominatim's
+        ~1 rps global policy keeps it effectively serial, while Google
+        permits real concurrency.
+
+        Args:
+            addresses: Address strings to geocode
+
+        Returns:
+            Dictionary mapping each successfully geocoded address to a GeoPoint
+        """
+        addresses = [a for a in addresses if not pd.isna(a)]
+        if not addresses:
+            return {}
+
+        # The async adapter needs aiohttp, which is optional; without it
+        # fall back to the sequential rate-limited path, which also
+        # answers repeats from the persistent cache
+        try:
+            from geopy.adapters import AioHTTPAdapter  # noqa: F401
+        except ImportError:
+            results = {}
+            for address in addresses:
+                point = self.geocode(address)
+                if point:
+                    results[address] = point
+            return results
+
+        if self.provider == 'google':
+            min_delay, batch_size = 0.1, 10
+        else:
+            min_delay, batch_size = 1.1, 50
+
+        return asyncio.run(self._geocode_many_async(addresses, min_delay, batch_size))
+
+    async def _geocode_many_async(self, addresses: list, min_delay: float,
+                                  batch_size: int) -> Dict[str, GeoPoint]:
+        """Async worker for geocode_many: gather batches behind a rate limiter."""
+        from geopy.adapters import AioHTTPAdapter
+        from geopy.extra.rate_limiter import AsyncRateLimiter
+
+        # Answer repeat addresses from the persistent cache before going
+        # online, mirroring _geocode_with_retry; only misses are gathered
+        results: Dict[str, GeoPoint] = {}
+        to_fetch = []
+        for address in addresses:
+            hit, cached = self.cache.get(address)
+            if hit:
+                if cached:
+                    results[address] = cached
+                continue
+            to_fetch.append(address)
+        if not to_fetch:
+            return results
+
+        if self.provider == 'google':
+            geocoder = GoogleV3(api_key=self.api_key, adapter_factory=AioHTTPAdapter, **self.kwargs)
+        else:
+            geocoder = Nominatim(user_agent=self.user_agent, adapter_factory=AioHTTPAdapter, **self.kwargs)
+
+        async with geocoder:
+            limiter = AsyncRateLimiter(
+                geocoder.geocode,
+                min_delay_seconds=min_delay,
+                max_retries=3,
+                return_value_on_exception=None
+            )
+            for start in range(0, len(to_fetch), batch_size):
+                batch = to_fetch[start:start + batch_size]
+                locations = await asyncio.gather(*(limiter(address) for address in batch))
+                for address, location in zip(batch, locations):
+                    if location:
+                        point = GeoPoint(
+                            latitude=location.latitude,
+                            longitude=location.longitude,
+                            address=location.raw.get('address', {}) if hasattr(location, 'raw') else {},
+                            raw=location.raw if hasattr(location, 'raw') else None
+                        )
+                        self.cache.put(address, point)
+                        results[address] = point
+                    else:
+                        # Remember the miss too, so unknown addresses
+                        # aren't retried on every run
+                        self.cache.put(address, None)
+
+        return results
+
+    def geocode_dataframe(self,
                          df: pd.DataFrame, 
                          address_col: str = 'location',
                          lat_col: str = 'latitude',
@@ -108,36 +286,44 @@ class GeoCoder:
         
         print(f"Geocoding {len(to_geocode)} unique locations...")
         
-        # Create a mapping of address to coordinates
-        geo_cache = {}
+        # Build one address->value map per output column
+        lat_map = {}
+        lon_map = {}
+        component_maps = {comp: {} for comp in (address_components or [])}
         for address in to_geocode:
             if pd.isna(address):
                 continue
-                
+
             result = self.geocode(address)
             if result:
-                geo_cache[address] = {
-                    lat_col: result.latitude,
-                    lon_col: result.longitude
-                }
-                
-                # Add address components if requested
+                lat_map[address] = result.latitude
+                lon_map[address] = result.longitude
+
+                # Collect address components if requested
                 if address_components and result.address:
                     for comp in address_components:
                         if comp in result.address:
-                            geo_cache[address][comp] = result.address[comp]
-            
-            # Small delay to be nice to the geocoding service
-            time.sleep(0.1)
-        
-        # Update the DataFrame with geocoded data
-        for address, coords in geo_cache.items():
-            mask = (df[address_col] == address) & (df[lat_col].isna() | df[lon_col].isna())
-            for col, value in coords.items():
-                if col in df.columns:
-                    df.loc[mask, col] = value
-        
-        print(f"Geocoding complete. {len(geo_cache)}/{len(to_geocode)} locations geocoded successfully.")
+                            component_maps[comp][address] = result.address[comp]
+
+        # Fill the rows that were missing coordinates with one vectorized
+        # map per column, instead of rebuilding a boolean mask per address.
+        # fillna keeps existing values on rows whose address failed to
+        # geocode (the map yields NaN there, which must not overwrite a
+        # partial coordinate)
+        need = df[lat_col].isna() | df[lon_col].isna()
+        df.loc[need, lat_col] = (
+            df.loc[need, address_col].map(lat_map).fillna(df.loc[need, lat_col])
+        )
+        df.loc[need, lon_col] = (
+            df.loc[need, address_col].map(lon_map).fillna(df.loc[need, lon_col])
+        )
+        for comp, comp_map in component_maps.items():
+            if comp in df.columns and comp_map:
+                df.loc[need, comp] = (
+                    df.loc[need, address_col].map(comp_map).fillna(df.loc[need, comp])
+                )
+
+        print(f"Geocoding complete. {len(lat_map)}/{len(to_geocode)} locations geocoded successfully.")
         return df
 
 def reverse_geocode(latitude: float, longitude: float, provider: str = 'nominatim', **kwargs) -> Optional[Dict[str, Any]]:
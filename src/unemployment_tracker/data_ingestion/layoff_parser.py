@@ -1,9 +1,12 @@
+import itertools
 import os
 import pandas as pd
 from geopy.geocoders import Nominatim
 from geopy.extra.rate_limiter import RateLimiter
 from dotenv import load_dotenv
 
+from data_ingestion.geocode_util import GeoCache, GeoPoint
+
 # Load environment variables
 load_dotenv()
 
@@ -27,6 +30,9 @@ class LayoffDataParser:
             min_delay_seconds=1,
             return_value_on_exception=None
         )
+        # Persistent cache shared with GeoCoder: locations already resolved
+        # on any previous run (by either class) never hit the API again
+        self.geo_cache = GeoCache()
         
     def load_data(self, file_path=None):
         """Load layoff data from a CSV file.
@@ -39,10 +45,49 @@ class LayoffDataParser:
         """
         file_path = file_path or self.data_path
         try:
-            return pd.read_csv(file_path)
+            return pd.read_csv(file_path, **self._read_csv_kwargs(file_path))
         except FileNotFoundError:
             print(f"Error: File not found at {file_path}")
             return pd.DataFrame()
+
+    @staticmethod
+    def _read_csv_kwargs(file_path):
+        """Build read_csv parse hints from the file's actual header.
+
+        Reading the header first means the dtype/date hints below only name
+        columns that exist, and the C parser then handles numbers, thousands
+        separators and dates in its single pass (clean_data would otherwise
+        re-scan those columns).
+        """
+        header = pd.read_csv(file_path, nrows=0).columns
+        normalized = {col: col.lower().replace(' ', '_') for col in header}
+        return {
+            'dtype': {col: 'string' for col, name in normalized.items()
+                      if name in ('company', 'industry', 'location')},
+            'parse_dates': [col for col, name in normalized.items()
+                            if name in ('date_announced', 'date_added', 'last_updated')],
+            'thousands': ',',
+            'engine': 'c'
+        }
+
+    def iter_chunks(self, file_path=None, chunksize=100_000):
+        """Yield cleaned chunks of a layoff CSV, capping peak memory.
+
+        Args:
+            file_path (str, optional): Path to the layoff data file
+            chunksize (int): Rows per chunk
+
+        Yields:
+            pd.DataFrame: Cleaned chunks of at most chunksize rows
+        """
+        file_path = file_path or self.data_path
+        try:
+            kwargs = self._read_csv_kwargs(file_path)
+            with pd.read_csv(file_path, chunksize=chunksize, **kwargs) as reader:
+                for chunk in reader:
+                    yield self.clean_data(chunk)
+        except FileNotFoundError:
+            print(f"Error: File not found at {file_path}")
     
     def clean_data(self, df):
         """Clean and standardize the layoff data.
@@ -62,26 +107,34 @@ class LayoffDataParser:
         # Standardize column names
         df.columns = df.columns.str.lower().str.replace(' ', '_')
         
-        # Handle missing values
-        df['employees_laid_off'] = pd.to_numeric(
-            df['employees_laid_off'].astype(str).str.replace(',', ''), 
-            errors='coerce'
-        )
-        
-        # Convert date columns to datetime
+        # Handle missing values (skipped when read_csv already parsed the
+        # column numerically via its thousands separator support)
+        if not pd.api.types.is_numeric_dtype(df['employees_laid_off']):
+            df['employees_laid_off'] = pd.to_numeric(
+                df['employees_laid_off'].astype(str).str.replace(',', ''),
+                errors='coerce'
+            )
+
+        # Convert date columns to datetime unless read_csv parsed them already
         date_columns = ['date_announced', 'date_added', 'last_updated']
         for col in date_columns:
-            if col in df.columns:
+            if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
                 df[col] = pd.to_datetime(df[col], errors='coerce')
-        
+
         # Standardize company names
         if 'company' in df.columns:
-            df['company'] = df['company'].str.title().str.strip()
-            
+            df['company'] = df['company'].str.strip().str.title()
+
         # Standardize industry names
         if 'industry' in df.columns:
-            df['industry'] = df['industry'].str.title().str.strip()
-        
+            df['industry'] = df['industry'].str.strip().str.title()
+
+        # Bounded-cardinality string columns become categoricals: int codes
+        # plus a small label table instead of one Python object per row
+        for col in ('company', 'industry', 'location'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+
         return df
     
     def geocode_locations(self, df, location_col='location'):
@@ -99,25 +152,35 @@ class LayoffDataParser:
             
         # Make a copy to avoid SettingWithCopyWarning
         df = df.copy()
-        
-        # Initialize columns
-        df['latitude'] = None
-        df['longitude'] = None
-        
-        # Only geocode locations that don't have coordinates yet
-        for idx, row in df.iterrows():
-            location_str = row[location_col]
-            if pd.isna(location_str):
+
+        # Geocode each unique location once; duplicate rows are filled by map
+        lat_map = {}
+        lon_map = {}
+        for location_str in df[location_col].dropna().unique():
+            hit, cached = self.geo_cache.get(location_str)
+            if hit:
+                if cached:
+                    lat_map[location_str] = cached.latitude
+                    lon_map[location_str] = cached.longitude
                 continue
-                
             try:
                 location = self.geocode(location_str)
                 if location:
-                    df.at[idx, 'latitude'] = location.latitude
-                    df.at[idx, 'longitude'] = location.longitude
+                    lat_map[location_str] = location.latitude
+                    lon_map[location_str] = location.longitude
+                    self.geo_cache.put(location_str, GeoPoint(
+                        latitude=location.latitude,
+                        longitude=location.longitude,
+                        raw=getattr(location, 'raw', None)
+                    ))
+                else:
+                    self.geo_cache.put(location_str, None)
             except Exception as e:
                 print(f"Error geocoding {location_str}: {e}")
-                
+
+        df['latitude'] = df[location_col].map(lat_map).astype('float32')
+        df['longitude'] = df[location_col].map(lon_map).astype('float32')
+
         return df
     
     def process_layoff_data(self, input_path=None, output_path=None):
@@ -130,25 +193,30 @@ class LayoffDataParser:
         Returns:
             pd.DataFrame: Processed layoff data
         """
-        # Load the data
-        df = self.load_data(input_path or self.data_path)
-        if df.empty:
-            return df
-        
-        # Clean the data
-        df_clean = self.clean_data(df)
-        
-        # Add geocoding
-        if 'location' in df_clean.columns:
-            print("Geocoding locations (this may take a while)...")
-            df_clean = self.geocode_locations(df_clean)
-        
-        # Save the processed data
+        # Stream the input in chunks: each chunk is cleaned, geocoded and
+        # appended to the output before the next one is read, so peak memory
+        # stays O(chunksize) on the write path. The persistent geocode cache
+        # keeps locations repeated across chunks from re-hitting the API.
+        chunks = self.iter_chunks(input_path)
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
+            return pd.DataFrame()
+
+        print("Geocoding locations (this may take a while)...")
+
+        # Save the processed data through an explicitly buffered binary
+        # handle; to_csv(path) reopens with default buffering
         output_path = output_path or "../data/processed/processed_layoffs.csv"
-        df_clean.to_csv(output_path, index=False)
+        processed = []
+        with open(output_path, 'wb', buffering=1 << 20) as fh:
+            for i, chunk in enumerate(itertools.chain([first_chunk], chunks)):
+                if 'location' in chunk.columns:
+                    chunk = self.geocode_locations(chunk)
+                chunk.to_csv(fh, index=False, header=(i == 0))
+                processed.append(chunk)
         print(f"Processed data saved to {output_path}")
-        
-        return df_clean
+
+        return processed[0] if len(processed) == 1 else pd.concat(processed, ignore_index=True)
 
 
 def main():
@@ -1,10 +1,14 @@
+import itertools
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Tuple, Optional, Set
+from typing import List, Dict, FrozenSet, Tuple, Optional, Set
 from dataclasses import dataclass
 from collections import defaultdict
 import networkx as nx
 
+# int.bit_count needs Python 3.10+; fall back to bin() counting on 3.8/3.9
+_popcount = getattr(int, 'bit_count', lambda mask: bin(mask).count('1'))
+
 @dataclass
 class Skill:
     """Class representing a skill with its properties."""
@@ -26,13 +30,19 @@ class JobProfile:
     average_salary: Optional[float] = None
     growth_rate: Optional[float] = None  # Annual growth rate
     
+    def __post_init__(self):
+        # Immutable skill-ID set, kept in sync by add_skill; hashable, so
+        # it can key memoization of pairwise computations
+        self.skill_ids: FrozenSet[str] = frozenset(self.required_skills)
+
     def add_skill(self, skill: Skill):
         """Add a skill to the job profile."""
         self.required_skills[skill.id] = skill
-    
-    def get_skill_ids(self) -> Set[str]:
+        self.skill_ids |= {skill.id}
+
+    def get_skill_ids(self) -> FrozenSet[str]:
         """Get set of skill IDs required for this job."""
-        return set(self.required_skills.keys())
+        return self.skill_ids
 
 @dataclass
 class TransitionPath:
@@ -65,46 +75,102 @@ class SkillMatcher:
     def __init__(self, job_profiles: Optional[Dict[str, JobProfile]] = None):
         """Initialize the SkillMatcher with optional job profiles."""
         self.job_profiles = job_profiles or {}
-        self.skill_graph = nx.Graph()
-        self._build_skill_graph()
-    
+        # Skill IDs interned to bit positions, and each job's skills packed
+        # into one integer bitmask so set overlap becomes &/| plus popcount
+        self._skill_index: Dict[str, int] = {}
+        self._job_masks: Dict[str, int] = {}
+        # Co-occurrence counts keyed by sorted skill-ID pairs; the networkx
+        # graph is only materialized on demand from these counts
+        self._cooc: Dict[Tuple[int, int], int] = defaultdict(int)
+        self._skill_attrs: Dict[str, Dict] = {}
+        self._graph_cache: Optional[nx.Graph] = None
+        # Lazily built (job_ids, similarity, sizes) tuple; None means stale
+        self._sim_cache = None
+        # Course catalog cache for recommend_training: the catalog object
+        # last scored, its usable courses, and their skill indicator matrix
+        self._course_catalog = None
+        self._course_meta: List[Dict] = []
+        self._course_skill_mat = np.zeros((0, 0), dtype=np.float32)
+        for job_id, profile in self.job_profiles.items():
+            self._job_masks[job_id] = self._skills_mask(profile.get_skill_ids())
+            self._record_cooccurrence(profile)
+
     def add_job_profile(self, profile: JobProfile):
         """Add a job profile to the matcher."""
         self.job_profiles[profile.id] = profile
-        self._update_skill_graph(profile)
-    
-    def _build_skill_graph(self):
-        """Build a graph of skills based on job profiles."""
-        # Add all skills as nodes
-        for job_id, profile in self.job_profiles.items():
-            for skill_id, skill in profile.required_skills.items():
-                self.skill_graph.add_node(skill_id, **skill.__dict__)
-        
-        # Add edges between skills that appear together in job profiles
-        for job_id, profile in self.job_profiles.items():
-            skills = list(profile.required_skills.keys())
-            for i in range(len(skills)):
-                for j in range(i + 1, len(skills)):
-                    if self.skill_graph.has_edge(skills[i], skills[j]):
-                        self.skill_graph[skills[i]][skills[j]]['weight'] += 1
-                    else:
-                        self.skill_graph.add_edge(skills[i], skills[j], weight=1)
+        self._job_masks[profile.id] = self._skills_mask(profile.get_skill_ids())
+        self._record_cooccurrence(profile)
+        self._sim_cache = None
+
+    def _skills_mask(self, skill_ids: Set[str]) -> int:
+        """Intern skill IDs and pack them into a single integer bitmask."""
+        index = self._skill_index
+        mask = 0
+        for skill_id in skill_ids:
+            bit = index.get(skill_id)
+            if bit is None:
+                bit = index[skill_id] = len(index)
+            mask |= 1 << bit
+        return mask
+
+    def similarity_matrix(self) -> Tuple[List[str], np.ndarray]:
+        """Return (job_ids, J x J Jaccard similarity matrix) over all profiles.
+
+        Built lazily from a (J x S) job/skill indicator matrix: all-pairs
+        intersections come from one BLAS matmul and unions from the skill
+        counts, so no per-pair Python loop runs. The result is cached until
+        add_job_profile invalidates it.
+        """
+        if self._sim_cache is None:
+            job_ids = list(self.job_profiles)
+            n_skills = max(len(self._skill_index), 1)
+            indicator = np.zeros((len(job_ids), n_skills), dtype=np.float32)
+            for row, job_id in enumerate(job_ids):
+                for skill_id in self.job_profiles[job_id].required_skills:
+                    indicator[row, self._skill_index[skill_id]] = 1.0
+
+            sizes = np.array(
+                [_popcount(self._job_masks.get(job_id, 0)) for job_id in job_ids],
+                dtype=np.float32
+            )
+            intersection = indicator @ indicator.T
+            union = sizes[:, None] + sizes[None, :] - intersection
+            similarity = intersection / np.where(union > 0, union, 1)
+            self._sim_cache = (job_ids, similarity, sizes)
+
+        return self._sim_cache[0], self._sim_cache[1]
     
-    def _update_skill_graph(self, profile: JobProfile):
-        """Update the skill graph with a new job profile."""
-        # Add new skills as nodes
+    def _record_cooccurrence(self, profile: JobProfile):
+        """Count skill co-occurrences for a profile into the pair counters.
+
+        Incrementing a dict counter per sorted skill pair replaces the old
+        has_edge/add_edge round trips through networkx on every insert.
+        """
         for skill_id, skill in profile.required_skills.items():
-            if not self.skill_graph.has_node(skill_id):
-                self.skill_graph.add_node(skill_id, **skill.__dict__)
-        
-        # Update edges
-        skills = list(profile.required_skills.keys())
-        for i in range(len(skills)):
-            for j in range(i + 1, len(skills)):
-                if self.skill_graph.has_edge(skills[i], skills[j]):
-                    self.skill_graph[skills[i]][skills[j]]['weight'] += 1
-                else:
-                    self.skill_graph.add_edge(skills[i], skills[j], weight=1)
+            self._skill_attrs.setdefault(skill_id, skill.__dict__)
+
+        ids = sorted(self._skill_index[s] for s in profile.required_skills)
+        for i, j in itertools.combinations(ids, 2):
+            self._cooc[(i, j)] += 1
+
+        self._graph_cache = None
+
+    @property
+    def skill_graph(self) -> nx.Graph:
+        """Skill co-occurrence graph, materialized lazily from the counters."""
+        if self._graph_cache is None:
+            graph = nx.Graph()
+            for skill_id, attrs in self._skill_attrs.items():
+                graph.add_node(skill_id, **attrs)
+
+            id_to_skill = {bit: skill_id for skill_id, bit in self._skill_index.items()}
+            graph.add_weighted_edges_from(
+                (id_to_skill[i], id_to_skill[j], weight)
+                for (i, j), weight in self._cooc.items()
+            )
+            self._graph_cache = graph
+
+        return self._graph_cache
     
     def find_similar_jobs(self, 
                          source_job_id: str, 
@@ -123,27 +189,23 @@ class SkillMatcher:
         if source_job_id not in self.job_profiles:
             return []
             
-        source_skills = self.job_profiles[source_job_id].get_skill_ids()
-        similarities = []
-        
-        for job_id, profile in self.job_profiles.items():
-            if job_id == source_job_id:
-                continue
-                
-            target_skills = profile.get_skill_ids()
-            if not target_skills:
-                continue
-                
-            # Calculate Jaccard similarity
-            intersection = len(source_skills & target_skills)
-            union = len(source_skills | target_skills)
-            similarity = intersection / union if union > 0 else 0
-            
-            if similarity >= min_skill_overlap:
-                similarities.append((job_id, similarity))
-        
-        # Sort by similarity (descending) and return top N
-        return sorted(similarities, key=lambda x: x[1], reverse=True)[:top_n]
+        self.similarity_matrix()  # ensure the cache is fresh
+        job_ids, similarity, sizes = self._sim_cache
+        row = job_ids.index(source_job_id)
+
+        # One row of the precomputed matrix holds every candidate's score;
+        # the source itself and jobs without skills are excluded
+        scores = similarity[row].copy()
+        scores[row] = -1.0
+        scores[sizes == 0] = -1.0
+
+        candidates = np.flatnonzero(scores >= min_skill_overlap)
+        if len(candidates) > top_n:
+            # argpartition narrows to the top N before the small final sort
+            candidates = candidates[np.argpartition(-scores[candidates], top_n - 1)[:top_n]]
+        candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+
+        return [(job_ids[i], float(scores[i])) for i in candidates]
     
     def find_transition_paths(self, 
                             source_job_id: str,
@@ -177,26 +239,37 @@ class SkillMatcher:
         if max_hops <= 0:
             return [direct_path] if direct_path.transition_difficulty < 1.0 else []
         
+        # Screen intermediate candidates with bitmask popcounts first: both
+        # legs are feasible (difficulty < 1.0) only when the candidate shares
+        # at least one skill with each endpoint, so the expensive set-based
+        # path construction below runs only for survivors
+        src_mask = self._job_masks.get(source_job_id, 0)
+        tgt_mask = self._job_masks.get(target_job_id, 0)
+        candidate_ids = [job_id for job_id in self.job_profiles
+                         if job_id not in (source_job_id, target_job_id)]
+        masks = [self._job_masks.get(job_id, 0) for job_id in candidate_ids]
+        inter_src = np.array([_popcount(mask & src_mask) for mask in masks])
+        inter_tgt = np.array([_popcount(mask & tgt_mask) for mask in masks])
+        feasible = (inter_src > 0) & (inter_tgt > 0)
+
         # Find intermediate jobs that could bridge the gap
         intermediate_paths = []
-        
-        for job_id, profile in self.job_profiles.items():
-            if job_id in [source_job_id, target_job_id]:
-                continue
-                
-            job_skills = profile.get_skill_ids()
-            
+
+        for index in np.flatnonzero(feasible):
+            job_id = candidate_ids[index]
+            job_skills = self.job_profiles[job_id].get_skill_ids()
+
             # Check if this job could be a good intermediate step
             to_intermediate = self._create_transition_path(
                 source_job_id, job_id, source_skills, job_skills)
-            
+
             intermediate_to_target = self._create_transition_path(
                 job_id, target_job_id, job_skills, target_skills)
-            
+
             # Only consider if both steps are feasible
-            if (to_intermediate.transition_difficulty < 1.0 and 
+            if (to_intermediate.transition_difficulty < 1.0 and
                 intermediate_to_target.transition_difficulty < 1.0):
-                
+
                 # Combine the two steps
                 combined_difficulty = max(
                     to_intermediate.transition_difficulty,
@@ -280,31 +353,53 @@ class SkillMatcher:
         
         if not missing_skills:
             return []
-        
-        # Score each course based on how many missing skills it covers
+
+        # (Re)build the course/skill matrix only when the catalog changes
+        if available_courses is not self._course_catalog:
+            self._load_course_catalog(available_courses)
+
+        if not self._course_meta:
+            return []
+
+        # One matrix-vector product scores every course at once
+        missing_vec = np.zeros(self._course_skill_mat.shape[1], dtype=np.float32)
+        for skill_id in missing_skills:
+            bit = self._skill_index.get(skill_id)
+            if bit is not None and bit < len(missing_vec):
+                missing_vec[bit] = 1.0
+        covered_counts = self._course_skill_mat @ missing_vec
+
+        # Materialize result dicts only for courses that cover something,
+        # in descending relevance order
         course_scores = []
-        
-        for course in available_courses:
-            if 'skills_covered' not in course:
-                continue
-                
+        for index in np.argsort(-covered_counts, kind='stable'):
+            if covered_counts[index] == 0:
+                break
+            course = self._course_meta[index]
             covered_skills = set(course['skills_covered']) & missing_skills
-            if not covered_skills:
-                continue
-                
-            # Calculate relevance score
-            relevance = len(covered_skills) / len(missing_skills)
-            
             course_scores.append({
                 'course_id': course.get('id'),
                 'title': course.get('title', 'Untitled Course'),
                 'provider': course.get('provider', 'Unknown'),
                 'url': course.get('url', ''),
                 'skills_covered': list(covered_skills),
-                'relevance_score': relevance,
+                'relevance_score': len(covered_skills) / len(missing_skills),
                 'missing_skills_covered': len(covered_skills),
                 'total_missing_skills': len(missing_skills)
             })
-        
-        # Sort by relevance (descending)
-        return sorted(course_scores, key=lambda x: x['relevance_score'], reverse=True)
+
+        return course_scores
+
+    def _load_course_catalog(self, courses: List[Dict]):
+        """Precompute the (courses x skills) indicator matrix for a catalog."""
+        self._course_catalog = courses
+        self._course_meta = [c for c in courses if 'skills_covered' in c]
+
+        for course in self._course_meta:
+            self._skills_mask(set(course['skills_covered']))  # intern new skills
+
+        matrix = np.zeros((len(self._course_meta), len(self._skill_index)), dtype=np.float32)
+        for row, course in enumerate(self._course_meta):
+            for skill_id in course['skills_covered']:
+                matrix[row, self._skill_index[skill_id]] = 1.0
+        self._course_skill_mat = matrix
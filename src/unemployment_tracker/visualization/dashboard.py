@@ -1,7 +1,5 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import os
 import json
@@ -10,7 +8,440 @@ import numpy as np
 
 # Custom imports
 from processing.trend_detector import TrendDetector, TrendDirection
-from visualization.map_view import UnemploymentMap
+
+# Plotly and Folium (via map_view) are imported lazily inside the display
+# functions that need them: they cost hundreds of ms at import time and a
+# session may never render the tabs that use them
+
+# st.fragment scopes reruns to the decorated body (Streamlit 1.37+);
+# older versions fall back to plain functions and full-script reruns
+_fragment = getattr(st, 'fragment', lambda func: func)
+
+
+def _ensure_parquet(csv_path: str) -> str:
+    """Return the Parquet twin of csv_path, converting from CSV if absent.
+
+    The pipeline writes Parquet directly, so an existing Parquet file is
+    the source of truth and is never overwritten here; a tracked CSV
+    without a twin (fresh clone) is parsed once, and every later load
+    reads the columnar, typed, compressed Parquet file instead.
+    """
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    if not os.path.exists(parquet_path):
+        df = pd.read_csv(csv_path, low_memory=False)
+        for col in ('date', 'date_announced', 'date_added', 'last_updated'):
+            if col in df.columns:
+                df[col] = pd.to_datetime(df[col], errors='coerce')
+        # Dictionary-encode bounded-cardinality string columns: isin and
+        # groupby then work on integer codes, and Parquet stores each
+        # label once instead of per row
+        for col in ('demographic', 'industry', 'company', 'location'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        df.to_parquet(parquet_path, engine='pyarrow', compression='zstd')
+    return parquet_path
+
+
+class DataStore:
+    """Loaded dashboard data plus the indices derived from it.
+
+    One instance per data version lives behind get_store, surviving
+    Streamlit's per-interaction script reruns; the dashboard class is a
+    thin view over it.
+    """
+
+    def __init__(self, data_dir: str):
+        """Load the processed data files and build derived structures.
+
+        Data comes from Parquet (converted from the CSVs on first read),
+        so dates arrive typed and string columns stay Arrow-backed
+        instead of materializing one Python object per row.
+        """
+        self.unemployment_df = pd.read_parquet(
+            _ensure_parquet(os.path.join(data_dir, 'processed', 'bls_unemployment.csv')),
+            engine='pyarrow',
+            dtype_backend='pyarrow'
+        )
+
+        self.layoff_df = pd.read_parquet(
+            _ensure_parquet(os.path.join(data_dir, 'processed', 'processed_layoffs.csv')),
+            engine='pyarrow',
+            dtype_backend='pyarrow'
+        )
+
+        # Keep both frames date-sorted (once per data version):
+        # _filter_data can then binary-search the date window instead of
+        # comparing every row
+        if not self.unemployment_df['date'].is_monotonic_increasing:
+            self.unemployment_df = self.unemployment_df.sort_values(
+                'date', ignore_index=True
+            )
+        if 'date_announced' in self.layoff_df.columns and \
+                not self.layoff_df['date_announced'].is_monotonic_increasing:
+            self.layoff_df = self.layoff_df.sort_values(
+                'date_announced', ignore_index=True
+            )
+
+        # Sidebar filter options from the dictionary label tables
+        self.demographics = _column_labels(self.unemployment_df['demographic'])
+        self.industries = _column_labels(self.layoff_df['industry'])
+        self.companies = _column_labels(self.layoff_df['company'])
+
+        # (demographic, date)-indexed view for the summary metrics.
+        # MultiIndex factorization wants numpy-backed key columns, so the
+        # Arrow-backed demographic/date columns are converted for the index
+        indexed = self.unemployment_df.assign(
+            demographic=self.unemployment_df['demographic'].astype(str),
+            date=self.unemployment_df['date'].astype('datetime64[ns]')
+        )
+        self.unemp_by_demo = indexed.set_index(['demographic', 'date']).sort_index()
+
+
+@st.cache_resource(max_entries=4)
+def get_store(data_dir: str, mtimes: Tuple[float, float]) -> DataStore:
+    """Singleton DataStore per data version.
+
+    mtimes is part of the cache key so reprocessed files bust the cache;
+    everything derived from the data loads exactly once per version.
+    """
+    return DataStore(data_dir)
+
+
+def _top_k(df: pd.DataFrame, col: str, k: int = 10) -> pd.DataFrame:
+    """Rows holding the k largest values of col, in descending order.
+
+    argpartition selects in O(N); only the k survivors pay for ordering,
+    unlike nlargest/sort_values which sort the whole frame.
+    """
+    values = df[col].to_numpy(dtype=np.float64)
+    if len(values) <= k:
+        return df.sort_values(col, ascending=False)
+    idx = np.argpartition(-values, k - 1)[:k]
+    idx = idx[np.argsort(-values[idx], kind='stable')]
+    return df.iloc[idx]
+
+
+def _date_window(df: pd.DataFrame, date_col: str, start_date, end_date) -> pd.DataFrame:
+    """Slice the rows of a date-sorted frame falling in [start, end]."""
+    dates = df[date_col].to_numpy()
+    lo = np.searchsorted(dates, np.datetime64(pd.Timestamp(start_date)), side='left')
+    hi = np.searchsorted(dates, np.datetime64(pd.Timestamp(end_date)), side='right')
+    return df.iloc[lo:hi]
+
+
+@st.cache_data(max_entries=64)
+def _compute_trends(data_dir: str, mtimes: Tuple[float, float],
+                    start_date, end_date, demographics: Tuple[str, ...]) -> Dict[str, Any]:
+    """Per-demographic trend results for one filter state.
+
+    Trends are deterministic in (data version, date range, demographics),
+    so each filter combination the user visits is computed once; later
+    widget reruns are cache hits.
+    """
+    store = get_store(data_dir, mtimes)
+    window = _date_window(store.unemployment_df, 'date', start_date, end_date)
+    if demographics:
+        window = window[window['demographic'].isin(demographics)]
+    if window.empty:
+        return {}
+
+    detector = TrendDetector()
+    return detector.detect_trends(
+        window,
+        value_col='value',
+        date_col='date',
+        group_cols=['demographic']
+    )
+
+
+def _column_labels(column: pd.Series) -> list:
+    """Sorted labels of a dictionary-encoded column.
+
+    Dictionary/categorical columns carry their label table, so this reads
+    a handful of entries instead of scanning every row for uniques.
+    """
+    import pyarrow as pa
+
+    dtype = column.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return sorted(dtype.categories)
+    pa_type = getattr(dtype, 'pyarrow_dtype', None)
+    if pa_type is not None and pa.types.is_dictionary(pa_type):
+        labels = column.array._pa_array.combine_chunks().dictionary.to_pylist()
+        return sorted(label for label in labels if label is not None)
+    return sorted(column.dropna().unique())
+
+
+@st.cache_data(max_entries=32)
+def _agg_layoffs(filtered_layoffs: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Industry and company aggregates for the layoff charts.
+
+    Both groupbys run in one cached call, so a rerun with unchanged
+    filters reuses the aggregates instead of re-grouping the rows.
+    """
+    by_industry = filtered_layoffs.groupby('industry', observed=True, sort=False).agg(
+        employees_laid_off=('employees_laid_off', 'sum'),
+        company=('company', 'count')
+    ).reset_index()
+    by_company = filtered_layoffs.groupby('company', observed=True, sort=False).agg(
+        employees_laid_off=('employees_laid_off', 'sum')
+    ).reset_index()
+    return by_industry, by_company
+
+
+@st.cache_resource(max_entries=32)
+def _build_layoff_map_html(lat_bytes: bytes, lon_bytes: bytes,
+                           companies: tuple, counts: tuple) -> str:
+    """Folium map HTML for one set of layoff markers.
+
+    Serializing the Folium object tree to HTML is the heaviest step of
+    the layoff tab; keying the cache on the raw coordinate bytes plus
+    marker labels makes reruns with unchanged filters a string lookup.
+    """
+    from visualization.map_view import UnemploymentMap
+
+    data = pd.DataFrame({
+        'latitude': np.frombuffer(lat_bytes, dtype=np.float64),
+        'longitude': np.frombuffer(lon_bytes, dtype=np.float64),
+        'company': list(companies),
+        'employees_laid_off': list(counts)
+    })
+
+    umap = UnemploymentMap(
+        location=(37.0902, -95.7129),  # Center of US
+        zoom_start=4
+    )
+    umap.add_circle_markers(
+        data=data,
+        latitude_col='latitude',
+        longitude_col='longitude',
+        popup_col='company',
+        tooltip_col='employees_laid_off',
+        radius=10,
+        color='#ff4b4b',
+        fill=True,
+        fill_opacity=0.7,
+        weight=1,
+        name='Layoffs'
+    )
+    umap.add_title("Company Layoffs by Location")
+    return umap.map._repr_html_()
+
+
+@_fragment
+def _display_unemployment_trends(filtered_unemployment: pd.DataFrame):
+    """Display unemployment trends over time.
+
+    Runs as a fragment: interactions inside this tab rerun only this
+    body, not the other tabs' Plotly/Folium work.
+    """
+    if filtered_unemployment.empty:
+        return
+
+    import plotly.graph_objects as go
+
+    st.subheader("Unemployment Trends")
+
+    # One line trace per demographic, fed numpy arrays directly; skips the
+    # pivot allocation and plotly express's wide-form melt and inference
+    fig = go.Figure()
+    grouped = filtered_unemployment.groupby('demographic', observed=True, sort=False)
+    for demo, group in grouped:
+        fig.add_scatter(
+            x=group['date'].to_numpy(),
+            y=group['value'].to_numpy(),
+            name=str(demo),
+            mode='lines'
+        )
+    fig.update_layout(title="Unemployment Rate Over Time", height=500)
+
+    # Update layout
+    fig.update_layout(
+        legend_title_text='Demographic',
+        hovermode='x unified',
+        xaxis_title='Date',
+        yaxis_title='Unemployment Rate (%)',
+        margin=dict(l=50, r=50, t=50, b=50)
+    )
+
+    # Add range slider
+    fig.update_xaxes(
+        rangeslider_visible=True,
+        rangeselector=dict(
+            buttons=list([
+                dict(count=1, label="1m", step="month", stepmode="backward"),
+                dict(count=6, label="6m", step="month", stepmode="backward"),
+                dict(count=1, label="YTD", step="year", stepmode="todate"),
+                dict(count=1, label="1y", step="year", stepmode="backward"),
+                dict(step="all")
+            ])
+        )
+    )
+
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@_fragment
+def _display_layoff_analysis(filtered_layoffs: pd.DataFrame):
+    """Display layoff analysis as a fragment (see _display_unemployment_trends)."""
+    if filtered_layoffs.empty:
+        return
+
+    import plotly.graph_objects as go
+
+    st.subheader("Layoff Analysis")
+
+    # Both chart aggregates come from one cached call; only the top rows
+    # of each get ordered
+    by_industry, by_company = _agg_layoffs(filtered_layoffs)
+    industry_layoffs = _top_k(by_industry, 'employees_laid_off')
+
+    # Create two columns for the charts
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Top industries by layoffs
+        fig = go.Figure(go.Bar(
+            x=industry_layoffs['employees_laid_off'].to_numpy(),
+            y=industry_layoffs['industry'].astype(str).to_numpy(),
+            orientation='h'
+        ))
+        fig.update_layout(
+            title='Top 10 Industries by Layoffs',
+            xaxis_title='Number of Employees Laid Off',
+            yaxis_title='Industry'
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        # Layoffs by company size
+        if 'total_employees' in filtered_layoffs.columns:
+            # Calculate layoff percentage on raw arrays, kept local so the
+            # shared filtered frame is never mutated inside a display path;
+            # zero or missing headcounts come out as 0 instead of inf/NaN
+            laid = filtered_layoffs['employees_laid_off'].to_numpy(dtype=np.float64)
+            total = filtered_layoffs['total_employees'].to_numpy(dtype=np.float64)
+            pct = np.where(total > 0, laid / np.where(total > 0, total, 1) * 100, 0.0)
+
+            # Top 10 via argpartition: O(N) selection instead of a full sort
+            k = min(10, pct.size)
+            top_idx = np.argpartition(-pct, k - 1)[:k]
+            top_idx = top_idx[np.argsort(-pct[top_idx], kind='stable')]
+            top_companies = filtered_layoffs.iloc[top_idx].assign(
+                layoff_percentage=pct[top_idx]
+            )
+
+            fig = go.Figure(go.Bar(
+                x=top_companies['layoff_percentage'].to_numpy(),
+                y=top_companies['company'].astype(str).to_numpy(),
+                orientation='h'
+            ))
+            fig.update_layout(
+                title='Top 10 Companies by Layoff Percentage',
+                xaxis_title='Layoff Percentage (%)',
+                yaxis_title='Company'
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            # Fallback to top companies by layoff count
+            top_companies = _top_k(by_company, 'employees_laid_off')
+
+            fig = go.Figure(go.Bar(
+                x=top_companies['employees_laid_off'].to_numpy(),
+                y=top_companies['company'].astype(str).to_numpy(),
+                orientation='h'
+            ))
+            fig.update_layout(
+                title='Top 10 Companies by Layoff Count',
+                xaxis_title='Number of Employees Laid Off',
+                yaxis_title='Company'
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
+    # Add a map of layoffs by location if we have location data
+    if 'latitude' in filtered_layoffs.columns and 'longitude' in filtered_layoffs.columns:
+        st.subheader("Layoff Map")
+
+        # Build (or fetch) the rendered map keyed on the marker data
+        map_html = _build_layoff_map_html(
+            filtered_layoffs['latitude'].to_numpy(dtype=np.float64).tobytes(),
+            filtered_layoffs['longitude'].to_numpy(dtype=np.float64).tobytes(),
+            tuple(filtered_layoffs['company'].astype(str)),
+            tuple(filtered_layoffs['employees_laid_off'].tolist())
+        )
+        st.components.v1.html(map_html, height=500)
+
+
+@_fragment
+def _display_trend_analysis(filtered_unemployment: pd.DataFrame, data_dir: str,
+                            mtimes: Tuple[float, float], date_range, demographics):
+    """Display trend analysis as a fragment (see _display_unemployment_trends)."""
+    if filtered_unemployment.empty:
+        return
+
+    st.subheader("Trend Analysis")
+
+    # One vectorized, cached call covers every demographic; reruns with
+    # the same filter state don't recompute anything
+    start_date, end_date = date_range
+    trend_results = _compute_trends(
+        data_dir,
+        mtimes,
+        start_date,
+        end_date,
+        tuple(demographics or ())
+    )
+
+    # Display trend results
+    if not trend_results:
+        st.info("Not enough data points for trend analysis.")
+        return
+
+    # Create a DataFrame for display
+    trend_data = []
+    for demo, trend in trend_results.items():
+        trend_data.append({
+            'Demographic': demo.capitalize(),
+            'Trend': trend.direction.value.capitalize(),
+            'Magnitude': f"{trend.magnitude:.1%}",
+            'Confidence': f"{trend.confidence:.0%}",
+            'Start Value': f"{trend.start_value:.1f}%",
+            'End Value': f"{trend.end_value:.1f}%"
+        })
+
+    # Sort by trend direction and magnitude
+    trend_df = pd.DataFrame(trend_data).sort_values(
+        by=['Trend', 'Magnitude'],
+        ascending=[True, False]
+    )
+
+    # Display the table with conditional formatting
+    st.dataframe(
+        trend_df,
+        column_config={
+            'Trend': st.column_config.SelectboxColumn(
+                'Trend',
+                options=[d.value.capitalize() for d in TrendDirection],
+                width='small'
+            ),
+            'Magnitude': st.column_config.ProgressColumn(
+                'Magnitude',
+                format='%f',
+                min_value=0,
+                max_value=1.0
+            )
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+
+    # Add some context
+    st.caption(
+        "Trend analysis shows the direction and strength of unemployment trends "
+        "over the selected time period. Confidence indicates how well the trend "
+        "fits the data (higher is better)."
+    )
+
 
 class UnemploymentDashboard:
     """Streamlit dashboard for unemployment data visualization."""
@@ -73,44 +504,36 @@ class UnemploymentDashboard:
     def _load_data(self):
         """Load the unemployment and layoff data."""
         try:
-            # Load unemployment data
-            self.unemployment_df = pd.read_csv(
-                os.path.join(self.data_dir, 'processed', 'bls_unemployment.csv'),
-                parse_dates=['date']
+            # Bind the per-data-version singleton store; the dashboard
+            # instance recreated on every rerun is just a view over it.
+            # The cache key is the mtimes of the Parquet files actually
+            # read, so a pipeline rerun busts the cache
+            mtimes = (
+                os.path.getmtime(_ensure_parquet(
+                    os.path.join(self.data_dir, 'processed', 'bls_unemployment.csv'))),
+                os.path.getmtime(_ensure_parquet(
+                    os.path.join(self.data_dir, 'processed', 'processed_layoffs.csv')))
             )
-            
-            # Load layoff data
-            self.layoff_df = pd.read_csv(
-                os.path.join(self.data_dir, 'processed', 'processed_layoffs.csv'),
-                parse_dates=['date_announced'],
-                low_memory=False
-            )
-            
-            # Convert date columns to datetime if they exist
-            date_columns = ['date_added', 'last_updated']
-            for col in date_columns:
-                if col in self.layoff_df.columns:
-                    self.layoff_df[col] = pd.to_datetime(
-                        self.layoff_df[col], 
-                        errors='coerce'
-                    )
-            
+            self._mtimes = mtimes
+            store = get_store(self.data_dir, mtimes)
+            self.unemployment_df = store.unemployment_df
+            self.layoff_df = store.layoff_df
+            self.demographics = store.demographics
+            self.industries = store.industries
+            self.companies = store.companies
+            self._unemp_by_demo = store.unemp_by_demo
+
             # Set default date range
             today = datetime.today()
             self.min_date = self.unemployment_df['date'].min().to_pydatetime()
             self.max_date = self.unemployment_df['date'].max().to_pydatetime()
-            
+
             # Default to last 2 years of data
             self.default_start_date = max(
                 self.min_date,
                 today - timedelta(days=730)  # ~2 years
             )
-            
-            # Get unique values for filters
-            self.demographics = sorted(self.unemployment_df['demographic'].unique())
-            self.industries = sorted(self.layoff_df['industry'].dropna().unique())
-            self.companies = sorted(self.layoff_df['company'].dropna().unique())
-            
+
         except Exception as e:
             st.error(f"Error loading data: {str(e)}")
             self.unemployment_df = pd.DataFrame()
@@ -122,21 +545,21 @@ class UnemploymentDashboard:
         
         # Date range filter
         st.sidebar.subheader("Date Range")
-        start_date = st.sidebar.date_input(
-            "Start Date",
-            value=self.default_start_date,
-            min_value=self.min_date,
-            max_value=self.max_date
-        )
-        
-        end_date = st.sidebar.date_input(
-            "End Date",
-            value=self.max_date,
+        # One range widget: picking both endpoints costs a single rerun
+        # instead of one per date input
+        selected_range = st.sidebar.date_input(
+            "Date Range",
+            value=(self.default_start_date, self.max_date),
             min_value=self.min_date,
             max_value=self.max_date
         )
-        
-        self.date_range = (start_date, end_date)
+
+        # While the user is mid-selection the widget returns one date;
+        # keep the open end pinned to the data bounds until both are set
+        if len(selected_range) == 2:
+            self.date_range = tuple(selected_range)
+        else:
+            self.date_range = (selected_range[0], self.max_date)
         
         # Demographic filter
         st.sidebar.subheader("Demographics")
@@ -199,32 +622,48 @@ class UnemploymentDashboard:
             # Filter by date range
             start_date, end_date = self.date_range
             
-            # Filter unemployment data
+            # Filter unemployment data: the frames are date-sorted, so the
+            # date window is a binary search plus a slice, and the value
+            # filters only scan the (often much smaller) window
             if not self.unemployment_df.empty:
-                mask = (
-                    (self.unemployment_df['date'] >= pd.Timestamp(start_date)) & 
-                    (self.unemployment_df['date'] <= pd.Timestamp(end_date))
-                )
-                
+                # Project to the columns the display paths actually read;
+                # nothing downstream mutates the filtered frames, so no
+                # defensive full-frame copy is needed
+                window = _date_window(
+                    self.unemployment_df, 'date', start_date, end_date
+                )[['date', 'demographic', 'value']]
+
                 if 'demographics' in self.filters and self.filters['demographics']:
-                    mask &= self.unemployment_df['demographic'].isin(self.filters['demographics'])
-                
-                self.filtered_unemployment = self.unemployment_df[mask].copy()
-            
+                    window = window[
+                        window['demographic'].isin(self.filters['demographics'])
+                    ]
+
+                self.filtered_unemployment = window
+
             # Filter layoff data if available
             if not self.layoff_df.empty:
-                mask = (
-                    (self.layoff_df['date_announced'] >= pd.Timestamp(start_date)) & 
-                    (self.layoff_df['date_announced'] <= pd.Timestamp(end_date))
-                )
-                
+                layoff_cols = [
+                    col for col in (
+                        'date_announced', 'company', 'industry',
+                        'employees_laid_off', 'total_employees',
+                        'latitude', 'longitude'
+                    ) if col in self.layoff_df.columns
+                ]
+                window = _date_window(
+                    self.layoff_df, 'date_announced', start_date, end_date
+                )[layoff_cols]
+
                 if 'industries' in self.filters and self.filters['industries']:
-                    mask &= self.layoff_df['industry'].isin(self.filters['industries'])
-                    
+                    window = window[
+                        window['industry'].isin(self.filters['industries'])
+                    ]
+
                 if 'companies' in self.filters and self.filters['companies']:
-                    mask &= self.layoff_df['company'].isin(self.filters['companies'])
-                
-                self.filtered_layoffs = self.layoff_df[mask].copy()
+                    window = window[
+                        window['company'].isin(self.filters['companies'])
+                    ]
+
+                self.filtered_layoffs = window
                 
         except Exception as e:
             st.error(f"Error filtering data: {str(e)}")
@@ -240,59 +679,42 @@ class UnemploymentDashboard:
                 st.warning("No unemployment data available for the selected filters.")
                 return
             
-            # Calculate metrics
-            latest_date = self.filtered_unemployment['date'].max()
-            latest_data = self.filtered_unemployment[
-                self.filtered_unemployment['date'] == latest_date
-            ]
-            
-            # Get the latest unemployment rate for the total demographic
-            total_unemployment_data = latest_data[
-                latest_data['demographic'] == 'total'
-            ]
-            
-            if total_unemployment_data.empty:
+            # The (demographic, date) index makes the latest and previous
+            # total lookups indexed slices instead of full scans and a sort
+            if self.filters.get('demographics') and \
+                    'total' not in self.filters['demographics']:
                 st.warning("No total unemployment data available for the selected period.")
                 return
-                
-            total_unemployment = total_unemployment_data['value'].values[0]
-            
+
+            start_date, end_date = self.date_range
+            try:
+                total_series = self._unemp_by_demo.loc['total', 'value'].loc[
+                    pd.Timestamp(start_date):pd.Timestamp(end_date)
+                ]
+            except KeyError:
+                total_series = pd.Series(dtype='float64')
+
+            if total_series.empty:
+                st.warning("No total unemployment data available for the selected period.")
+                return
+
+            total_unemployment = total_series.iat[-1]
+
             # Ensure we have a valid number
             if pd.isna(total_unemployment):
                 st.warning("Invalid unemployment data for the selected period.")
                 return
-            
-            # Calculate month-over-month change if we have enough data
+
+            # Month-over-month change is just the previous entry of the
+            # date-sorted total series
             mom_change = None
             mom_change_pct = None
-            
-            if len(self.filtered_unemployment) > 1:
-                try:
-                    # Get previous month's data
-                    prev_month_mask = (self.filtered_unemployment['date'] < latest_date)
-                    if prev_month_mask.any():
-                        # Get the most recent previous month's data
-                        prev_month_data = self.filtered_unemployment[prev_month_mask]\
-                            .sort_values('date', ascending=False)
-                        
-                        if not prev_month_data.empty:
-                            # Get the total unemployment for the previous month
-                            prev_month_total_data = prev_month_data[
-                                prev_month_data['demographic'] == 'total'
-                            ]
-                            
-                            if not prev_month_total_data.empty:
-                                prev_month_total = prev_month_total_data['value'].iloc[0]
-                                
-                                if not pd.isna(prev_month_total):
-                                    mom_change = total_unemployment - prev_month_total
-                                    mom_change_pct = (mom_change / prev_month_total) * 100 if prev_month_total != 0 else 0
-                except Exception as e:
-                    # Don't show the error to the user, just log it
-                    import logging
-                    logging.warning(f"Could not calculate month-over-month change: {str(e)}")
-                    logging.debug(f"Debug info: {traceback.format_exc()}")
-                    # Don't show a warning to the user to avoid cluttering the UI
+
+            if len(total_series) > 1:
+                prev_month_total = total_series.iat[-2]
+                if not pd.isna(prev_month_total):
+                    mom_change = total_unemployment - prev_month_total
+                    mom_change_pct = (mom_change / prev_month_total) * 100 if prev_month_total != 0 else 0
             
             # Get layoff data if available
             layoff_count = 0
@@ -333,228 +755,6 @@ class UnemploymentDashboard:
         except Exception as e:
             st.error(f"Error displaying summary metrics: {str(e)}")
     
-    def _display_unemployment_trends(self):
-        """Display unemployment trends over time."""
-        if self.filtered_unemployment.empty:
-            return
-        
-        st.subheader("Unemployment Trends")
-        
-        # Pivot the data for plotting
-        pivot_df = self.filtered_unemployment.pivot(
-            index='date',
-            columns='demographic',
-            values='value'
-        ).reset_index()
-        
-        # Create the plot
-        fig = px.line(
-            pivot_df,
-            x='date',
-            y=pivot_df.columns[1:],  # Skip the date column
-            title="Unemployment Rate Over Time",
-            labels={'value': 'Unemployment Rate (%)', 'date': 'Date'},
-            height=500
-        )
-        
-        # Update layout
-        fig.update_layout(
-            legend_title_text='Demographic',
-            hovermode='x unified',
-            xaxis_title='Date',
-            yaxis_title='Unemployment Rate (%)',
-            margin=dict(l=50, r=50, t=50, b=50)
-        )
-        
-        # Add range slider
-        fig.update_xaxes(
-            rangeslider_visible=True,
-            rangeselector=dict(
-                buttons=list([
-                    dict(count=1, label="1m", step="month", stepmode="backward"),
-                    dict(count=6, label="6m", step="month", stepmode="backward"),
-                    dict(count=1, label="YTD", step="year", stepmode="todate"),
-                    dict(count=1, label="1y", step="year", stepmode="backward"),
-                    dict(step="all")
-                ])
-            )
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-    
-    def _display_layoff_analysis(self):
-        """Display layoff analysis."""
-        if self.filtered_layoffs.empty:
-            return
-        
-        st.subheader("Layoff Analysis")
-        
-        # Group by industry and sum layoffs
-        industry_layoffs = self.filtered_layoffs.groupby('industry').agg({
-            'employees_laid_off': 'sum',
-            'company': 'count'
-        }).reset_index().sort_values('employees_laid_off', ascending=False)
-        
-        # Create two columns for the charts
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Top industries by layoffs
-            fig = px.bar(
-                industry_layoffs.head(10),
-                x='employees_laid_off',
-                y='industry',
-                orientation='h',
-                title='Top 10 Industries by Layoffs',
-                labels={'employees_laid_off': 'Number of Employees Laid Off', 'industry': 'Industry'}
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Layoffs by company size
-            if 'total_employees' in self.filtered_layoffs.columns:
-                # Calculate layoff percentage if total employees data is available
-                self.filtered_layoffs['layoff_percentage'] = (
-                    self.filtered_layoffs['employees_laid_off'] / 
-                    self.filtered_layoffs['total_employees'] * 100
-                )
-                
-                # Get top 10 companies by layoff percentage
-                top_companies = self.filtered_layoffs.nlargest(10, 'layoff_percentage')
-                
-                fig = px.bar(
-                    top_companies,
-                    x='layoff_percentage',
-                    y='company',
-                    orientation='h',
-                    title='Top 10 Companies by Layoff Percentage',
-                    labels={'layoff_percentage': 'Layoff Percentage (%)', 'company': 'Company'}
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                # Fallback to top companies by layoff count
-                top_companies = self.filtered_layoffs.groupby('company').agg({
-                    'employees_laid_off': 'sum'
-                }).reset_index().nlargest(10, 'employees_laid_off')
-                
-                fig = px.bar(
-                    top_companies,
-                    x='employees_laid_off',
-                    y='company',
-                    orientation='h',
-                    title='Top 10 Companies by Layoff Count',
-                    labels={'employees_laid_off': 'Number of Employees Laid Off', 'company': 'Company'}
-                )
-                st.plotly_chart(fig, use_container_width=True)
-        
-        # Add a map of layoffs by location if we have location data
-        if 'latitude' in self.filtered_layoffs.columns and 'longitude' in self.filtered_layoffs.columns:
-            st.subheader("Layoff Map")
-            
-            # Create a map centered on the US
-            umap = UnemploymentMap(
-                location=(37.0902, -95.7129),  # Center of US
-                zoom_start=4
-            )
-            
-            # Add circle markers for layoffs
-            umap.add_circle_markers(
-                data=self.filtered_layoffs,
-                latitude_col='latitude',
-                longitude_col='longitude',
-                popup_col='company',
-                tooltip_col='employees_laid_off',
-                radius=10,
-                color='#ff4b4b',
-                fill=True,
-                fill_opacity=0.7,
-                weight=1,
-                name='Layoffs'
-            )
-            
-            # Add a title to the map
-            umap.add_title("Company Layoffs by Location")
-            
-            # Display the map
-            st.components.v1.html(umap.map._repr_html_(), height=500)
-    
-    def _display_trend_analysis(self):
-        """Display trend analysis of unemployment data."""
-        if self.filtered_unemployment.empty:
-            return
-        
-        st.subheader("Trend Analysis")
-        
-        # Analyze trends for each demographic
-        trend_results = {}
-        for demo in self.filtered_unemployment['demographic'].unique():
-            demo_data = self.filtered_unemployment[
-                self.filtered_unemployment['demographic'] == demo
-            ]
-            
-            if len(demo_data) < 3:  # Need at least 3 points for trend analysis
-                continue
-                
-            result = self.trend_detector.detect_trends(
-                demo_data,
-                value_col='value',
-                date_col='date',
-                group_cols=['demographic']
-            )
-            
-            if result:
-                trend_results[demo] = result[demo]
-        
-        # Display trend results
-        if not trend_results:
-            st.info("Not enough data points for trend analysis.")
-            return
-        
-        # Create a DataFrame for display
-        trend_data = []
-        for demo, trend in trend_results.items():
-            trend_data.append({
-                'Demographic': demo.capitalize(),
-                'Trend': trend.direction.value.capitalize(),
-                'Magnitude': f"{trend.magnitude:.1%}",
-                'Confidence': f"{trend.confidence:.0%}",
-                'Start Value': f"{trend.start_value:.1f}%",
-                'End Value': f"{trend.end_value:.1f}%"
-            })
-        
-        # Sort by trend direction and magnitude
-        trend_df = pd.DataFrame(trend_data).sort_values(
-            by=['Trend', 'Magnitude'], 
-            ascending=[True, False]
-        )
-        
-        # Display the table with conditional formatting
-        st.dataframe(
-            trend_df,
-            column_config={
-                'Trend': st.column_config.SelectboxColumn(
-                    'Trend',
-                    options=[d.value.capitalize() for d in TrendDirection],
-                    width='small'
-                ),
-                'Magnitude': st.column_config.ProgressColumn(
-                    'Magnitude',
-                    format='%f',
-                    min_value=0,
-                    max_value=1.0
-                )
-            },
-            hide_index=True,
-            use_container_width=True
-        )
-        
-        # Add some context
-        st.caption(
-            "Trend analysis shows the direction and strength of unemployment trends "
-            "over the selected time period. Confidence indicates how well the trend "
-            "fits the data (higher is better)."
-        )
-    
     def run(self):
         """Run the dashboard."""
         # Set the title and description
@@ -577,13 +777,19 @@ class UnemploymentDashboard:
         tab1, tab2, tab3 = st.tabs(["Unemployment Trends", "Layoff Analysis", "Trend Analysis"])
         
         with tab1:
-            self._display_unemployment_trends()
-        
+            _display_unemployment_trends(self.filtered_unemployment)
+
         with tab2:
-            self._display_layoff_analysis()
-        
+            _display_layoff_analysis(self.filtered_layoffs)
+
         with tab3:
-            self._display_trend_analysis()
+            _display_trend_analysis(
+                self.filtered_unemployment,
+                self.data_dir,
+                self._mtimes,
+                self.date_range,
+                self.filters.get('demographics')
+            )
         
         # Add a footer
         st.markdown("---")
@@ -1,35 +1,477 @@
-import folium
-from folium.plugins import HeatMap, MarkerCluster
 import pandas as pd
 from typing import Optional, Dict, List, Tuple, Any, Union
 import numpy as np
-from branca.colormap import LinearColormap
+import base64
+import functools
+import gzip
+import hashlib
 import json
 import os
+import shutil
+
+# folium (and the branca/jinja2 stack it drags in) costs a few hundred
+# milliseconds to import, so it is imported inside the methods that
+# actually build maps; importing this module stays cheap for code that
+# never renders one
+
+# orjson's C encoder is several times faster than stdlib json and
+# serializes NumPy scalars directly; fall back to json when absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_geojson_file(path: str, mtime: float) -> Dict:
+    """Load and cache a GeoJSON file; mtime in the key busts stale entries."""
+    with open(path) as f:
+        return json.load(f)
+
+
+# Parsed JSON-string GeoJSON keyed by content hash; bounded like the
+# file cache above
+_PARSED_GEOJSON: Dict[str, Dict] = {}
+
+
+def _parse_geojson_str(text: str) -> Dict:
+    """Parse and cache a GeoJSON string (hundreds of ms on county files)."""
+    key = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    parsed = _PARSED_GEOJSON.get(key)
+    if parsed is None:
+        if len(_PARSED_GEOJSON) >= 8:
+            _PARSED_GEOJSON.pop(next(iter(_PARSED_GEOJSON)))
+        parsed = _PARSED_GEOJSON[key] = json.loads(text)
+    return parsed
+
+
+def _json_dumps(obj: Any, sort_keys: bool = False) -> str:
+    """Serialize to a compact JSON string with the fastest encoder available."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, separators=(',', ':'), sort_keys=sort_keys)
+
+
+# Simplified geometry keyed by source identity and tolerance, bounded
+# like the parse caches above; the geopandas pass costs far more than
+# the lookup, so repeated boundaries simplify once per process
+_SIMPLIFIED_GEOJSON: Dict[Any, Dict] = {}
+
+
+_MACRO_LAYERS: Dict[str, type] = {}
+
+
+def _macro_layers() -> Dict[str, type]:
+    """Build (once) the MacroElement subclasses that need folium loaded."""
+    if _MACRO_LAYERS:
+        return _MACRO_LAYERS
+
+    from branca.element import CssLink, JavascriptLink, MacroElement
+    from jinja2 import Template
+
+    class _BinaryHeatLayer(MacroElement):
+        """Heatmap layer whose points travel as a base64 Float32Array blob.
+
+        Instead of embedding a JSON array of [lat, lon, weight] lists, the
+        points are packed into float32 bytes in Python and decoded in the
+        page with a zero-copy Float32Array view. That cuts the bytes per
+        value from ~12 (JSON text) to 4 and skips the JSON parse, which is
+        the hotspot when a heatmap has many points.
+        """
+
+        _template = Template("""
+        {% macro script(this, kwargs) %}
+        var {{ this.get_name() }}_bytes = Uint8Array.from(
+            atob("{{ this.encoded }}"), function (c) { return c.charCodeAt(0); });
+        var {{ this.get_name() }}_f32 = new Float32Array({{ this.get_name() }}_bytes.buffer);
+        var {{ this.get_name() }}_pts = [];
+        for (var i = 0; i < {{ this.get_name() }}_f32.length; i += {{ this.stride }}) {
+            {{ this.get_name() }}_pts.push(Array.prototype.slice.call(
+                {{ this.get_name() }}_f32, i, i + {{ this.stride }}));
+        }
+        var {{ this.get_name() }} = L.heatLayer(
+            {{ this.get_name() }}_pts,
+            {radius: {{ this.radius }}, blur: {{ this.blur }}, maxZoom: {{ this.max_zoom }}}
+        ).addTo({{ this._parent.get_name() }});
+        {% endmacro %}
+        """)
+
+        def __init__(self, encoded: str, stride: int, radius: int, blur: int, max_zoom: int):
+            super().__init__()
+            self._name = 'BinaryHeatLayer'
+            self.encoded = encoded
+            self.stride = stride
+            self.radius = radius
+            self.blur = blur
+            self.max_zoom = max_zoom
+
+        def render(self, **kwargs) -> None:
+            super().render(**kwargs)
+            # Same leaflet-heat script the HeatMap plugin pulls in
+            self.get_root().header.add_child(
+                JavascriptLink(
+                    'https://cdn.jsdelivr.net/gh/python-visualization/'
+                    'folium@main/folium/templates/leaflet_heat.min.js'
+                ),
+                name='leaflet-heat'
+            )
+
+    class _ExternalGeoJsonLayer(MacroElement):
+        """Choropleth layer that fetches its geometry from a sidecar file.
+
+        The polygons are written next to the saved HTML instead of being
+        inlined into it, so the page stays small and the geometry can be
+        browser-cached and served compressed across repeat visits. The
+        per-feature fill colors are computed in Python and shipped as a
+        small id-to-color map.
+        """
+
+        _template = Template("""
+        {% macro script(this, kwargs) %}
+        fetch("{{ this.url }}")
+            .then(function (resp) { return resp.json(); })
+            .then(function (gj) {
+                var colors = {{ this.colors_json }};
+                L.geoJSON(gj, {
+                    style: function (feature) {
+                        return {
+                            fillColor: colors[String(feature.properties["{{ this.key_prop }}"])] || "#d3d3d3",
+                            fillOpacity: {{ this.fill_opacity }},
+                            color: "#333333",
+                            opacity: {{ this.line_opacity }},
+                            weight: 1
+                        };
+                    }
+                }).addTo({{ this._parent.get_name() }});
+            });
+        {% endmacro %}
+        """)
+
+        def __init__(self, key_prop: str, colors_json: str,
+                     fill_opacity: float, line_opacity: float):
+            super().__init__()
+            self._name = 'ExternalGeoJsonLayer'
+            self.url = None  # filled in by UnemploymentMap.save
+            self.key_prop = key_prop
+            self.colors_json = colors_json
+            self.fill_opacity = fill_opacity
+            self.line_opacity = line_opacity
+
+    class _BulkMarkerLayer(MacroElement):
+        """Cluster of circle markers emitted as pre-rendered JS.
+
+        folium runs the full jinja2 child-template pipeline per
+        CircleMarker, which dominates emission time for thousands of
+        markers. When every marker shares its styling, the JS lines are
+        generated with plain string formatting instead and dropped into
+        the page in one block.
+        """
+
+        _template = Template("""
+        {% macro script(this, kwargs) %}
+        (function () {
+            var cluster = L.markerClusterGroup();
+            {{ this.lines }}
+            {{ this._parent.get_name() }}.addLayer(cluster);
+        })();
+        {% endmacro %}
+        """)
+
+        def __init__(self, lines: str):
+            super().__init__()
+            self._name = 'BulkMarkerLayer'
+            self.lines = lines
+
+        def render(self, **kwargs) -> None:
+            super().render(**kwargs)
+            # Same scripts/styles the MarkerCluster plugin pulls in
+            header = self.get_root().header
+            header.add_child(JavascriptLink(
+                'https://cdn.jsdelivr.net/npm/leaflet.markercluster@1.1.0/'
+                'dist/leaflet.markercluster.js'), name='markerclusterjs')
+            header.add_child(CssLink(
+                'https://cdn.jsdelivr.net/npm/leaflet.markercluster@1.1.0/'
+                'dist/MarkerCluster.css'), name='markerclustercss')
+            header.add_child(CssLink(
+                'https://cdn.jsdelivr.net/npm/leaflet.markercluster@1.1.0/'
+                'dist/MarkerCluster.Default.css'), name='markerclusterdefaultcss')
+
+    class _TiledMarkerLayer(MacroElement):
+        """Marker layer whose points load lazily from per-tile JSON files.
+
+        The full marker array never ships with the page; save() writes
+        the points bucketed into slippy-map tiles and this macro fetches
+        only the tiles covering the current viewport, on load and on
+        every moveend.
+        """
+
+        _template = Template("""
+        {% macro script(this, kwargs) %}
+        (function () {
+            var map = {{ this._parent._parent.get_name() }};
+            var group = L.layerGroup().addTo({{ this._parent.get_name() }});
+            var zoom = {{ this.tile_zoom }};
+            var options = {{ this.options_json }};
+            var n = Math.pow(2, zoom);
+            var loaded = {};
+            function tileX(lon) { return Math.floor((lon + 180) / 360 * n); }
+            function tileY(lat) {
+                var r = lat * Math.PI / 180;
+                return Math.floor((1 - Math.asinh(Math.tan(r)) / Math.PI) / 2 * n);
+            }
+            function addPoints(pts) {
+                for (var i = 0; i < pts.length; i++) {
+                    var m = L.circleMarker([pts[i][0], pts[i][1]], options);
+                    if (pts[i].length > 2 && pts[i][2] !== null) m.bindPopup(pts[i][2]);
+                    if (pts[i].length > 3 && pts[i][3] !== null) m.bindTooltip(pts[i][3]);
+                    m.addTo(group);
+                }
+            }
+            function load() {
+                var b = map.getBounds();
+                var x0 = Math.max(0, tileX(b.getWest()));
+                var x1 = Math.min(n - 1, tileX(b.getEast()));
+                var y0 = Math.max(0, tileY(b.getNorth()));
+                var y1 = Math.min(n - 1, tileY(b.getSouth()));
+                for (var x = x0; x <= x1; x++) {
+                    for (var y = y0; y <= y1; y++) {
+                        var key = x + "_" + y;
+                        if (loaded[key]) continue;
+                        loaded[key] = true;
+                        fetch("{{ this.base_url }}/" + zoom + "/" + x + "/" + y + ".json")
+                            .then(function (r) { return r.ok ? r.json() : []; })
+                            .then(addPoints);
+                    }
+                }
+            }
+            map.on('moveend', load);
+            load();
+        })();
+        {% endmacro %}
+        """)
+
+        def __init__(self, tile_zoom: int, options_json: str):
+            super().__init__()
+            self._name = 'TiledMarkerLayer'
+            self.base_url = None  # filled in by UnemploymentMap.save
+            self.tile_zoom = tile_zoom
+            self.options_json = options_json
+
+    _MACRO_LAYERS['binary_heat'] = _BinaryHeatLayer
+    _MACRO_LAYERS['external_geojson'] = _ExternalGeoJsonLayer
+    _MACRO_LAYERS['bulk_markers'] = _BulkMarkerLayer
+    _MACRO_LAYERS['tiled_markers'] = _TiledMarkerLayer
+    return _MACRO_LAYERS
+
 
 class UnemploymentMap:
     """Class for creating interactive maps of unemployment and layoff data."""
-    
-    def __init__(self, 
+
+    # Output directories already created by save(), shared process-wide
+    _ensured_dirs: set = set()
+
+    def __init__(self,
                 location: Tuple[float, float] = (37.0902, -95.7129),  # Center of US
                 zoom_start: int = 4,
-                tiles: str = 'cartodbpositron'):
+                tiles: str = 'cartodbpositron',
+                prefer_canvas: bool = True):
         """Initialize the map.
-        
+
         Args:
             location: (lat, lon) tuple for the initial map center
             zoom_start: Initial zoom level
             tiles: Map tiles to use (default: CartoDB Positron)
+            prefer_canvas: Render vector layers to a shared canvas
+                instead of one SVG DOM node per marker; the browser
+                rasterizes N circles in one pass rather than laying out
+                N elements
         """
+        import folium
+
         self.map = folium.Map(
             location=location,
             zoom_start=zoom_start,
             tiles=tiles,
-            control_scale=True
+            control_scale=True,
+            prefer_canvas=prefer_canvas
         )
-        self.layers = {}
-        self.feature_groups = {}
-    
+        # Single append-only registry of (name, kind, FeatureGroup); one
+        # list append per layer instead of parallel dict mutations
+        self._layers: List[Tuple[str, str, Any]] = []
+        # Geometry to write as sidecar .geojson files at save time
+        self._pending_geojson: List[Tuple[str, Dict, Any]] = []
+        # Marker tiles to write as per-tile JSON files at save time
+        self._pending_marker_tiles: List[Tuple[str, int, Dict, Any]] = []
+        # Running hash of everything that shapes the rendered output,
+        # used by save(use_cache=True) to skip re-rendering identical maps
+        self._content_hash = hashlib.blake2b(
+            repr((location, zoom_start, tiles, prefer_canvas)).encode(), digest_size=16
+        )
+
+    def _register(self, name: str, kind: str) -> 'folium.FeatureGroup':
+        """Create, attach, and record the FeatureGroup for a new layer."""
+        import folium
+
+        group = folium.FeatureGroup(name=name, show=True)
+        group.add_to(self.map)
+        self._layers.append((name, kind, group))
+        return group
+
+    @property
+    def cache_key(self) -> str:
+        """Hex digest identifying the map's data and styling so far."""
+        return self._content_hash.hexdigest()
+
+    def _update_content_hash(self, data: Optional[pd.DataFrame], meta: tuple) -> None:
+        """Fold one layer's data and options into the content hash."""
+        if data is not None:
+            self._content_hash.update(
+                pd.util.hash_pandas_object(data, index=True).values.tobytes()
+            )
+        self._content_hash.update(repr(meta).encode())
+
+    @staticmethod
+    def _cache_path(key: str) -> str:
+        """Path of the cached HTML for a given content hash."""
+        cache_dir = os.path.join(
+            os.path.expanduser('~'), '.cache', 'unemployment_tracker', 'maps'
+        )
+        os.makedirs(cache_dir, exist_ok=True)
+        return os.path.join(cache_dir, f"{key}.html")
+
+    @staticmethod
+    def from_cache(key: str) -> Optional[str]:
+        """Return the cached HTML for a previously saved map, if any.
+
+        Args:
+            key: A cache_key from an earlier UnemploymentMap
+
+        Returns:
+            The cached HTML string, or None on a cache miss
+        """
+        path = UnemploymentMap._cache_path(key)
+        if os.path.exists(path):
+            with open(path) as f:
+                return f.read()
+        return None
+
+    @staticmethod
+    def _has_name_property(geo_data: Union[str, Dict]) -> bool:
+        """Check whether the features carry a NAME property.
+
+        Inspects the first feature's properties — O(1) — instead of the
+        old substring scan over the full GeoJSON text, which walked the
+        entire payload and could never match real GeoJSON anyway.
+        """
+        if not isinstance(geo_data, dict):
+            return False
+        features = geo_data.get('features')
+        return bool(features) and 'NAME' in features[0].get('properties', {})
+
+    @staticmethod
+    def _simplify_geo_data(geo_data: Union[str, Dict], tolerance: float) -> Dict:
+        """Simplify polygon boundaries before they are rendered.
+
+        County and tract boundaries carry far more vertices than any
+        overview zoom can display; Douglas-Peucker simplification keyed
+        to the intended zoom removes the invisible ones, which shrinks
+        the HTML and the number of SVG path points the browser has to
+        rasterize.
+
+        Args:
+            geo_data: GeoJSON string, file path, or dict
+            tolerance: Simplification tolerance in degrees
+
+        Returns:
+            Simplified GeoJSON dict
+        """
+        if isinstance(geo_data, str) and os.path.exists(geo_data):
+            key = (os.path.abspath(geo_data), os.path.getmtime(geo_data), tolerance)
+        else:
+            if isinstance(geo_data, str):
+                geo_data = json.loads(geo_data)
+            digest = hashlib.blake2b(
+                _json_dumps(geo_data, sort_keys=True).encode(), digest_size=16
+            ).hexdigest()
+            key = (digest, tolerance)
+
+        simplified = _SIMPLIFIED_GEOJSON.get(key)
+        if simplified is not None:
+            return simplified
+
+        # geopandas is heavy; only pay for the import on this path
+        import geopandas as gpd
+        from shapely.geometry import mapping, shape
+
+        if isinstance(geo_data, str):
+            gdf = gpd.read_file(geo_data)
+            gdf.geometry = gdf.geometry.simplify(tolerance, preserve_topology=True)
+            simplified = json.loads(gdf.to_json())
+        else:
+            # Replace only the geometries, so feature ids and properties
+            # survive untouched (a GeoDataFrame round-trip rewrites ids
+            # to the 0..N-1 index, breaking key_on='feature.id' joins)
+            features = geo_data.get('features', [])
+            geoms = gpd.GeoSeries([shape(f['geometry']) for f in features])
+            geoms = geoms.simplify(tolerance, preserve_topology=True)
+            simplified = dict(geo_data, features=[
+                dict(f, geometry=mapping(g)) for f, g in zip(features, geoms)
+            ])
+
+        if len(_SIMPLIFIED_GEOJSON) >= 8:
+            _SIMPLIFIED_GEOJSON.pop(next(iter(_SIMPLIFIED_GEOJSON)))
+        _SIMPLIFIED_GEOJSON[key] = simplified
+        return simplified
+
+    @staticmethod
+    def _compact_geo_data(geo_data: Union[str, Dict],
+                          key_on: str,
+                          precision: int = 5) -> Dict:
+        """Shrink a GeoJSON payload before it is inlined into the HTML.
+
+        Rounds coordinates to a fixed precision (5 decimals is ~1 m,
+        far below what any zoom level here can show) and drops every
+        feature property except the join key and NAME, which are the
+        only ones the choropleth and its tooltip read. Large county or
+        tract files typically shrink severalfold.
+
+        Args:
+            geo_data: GeoJSON string, file path, or dict
+            key_on: folium key_on expression; its last segment is the
+                property to keep for the data join
+            precision: Decimal places to keep in coordinates
+
+        Returns:
+            Compacted GeoJSON dict
+        """
+        if isinstance(geo_data, str):
+            if os.path.exists(geo_data):
+                with open(geo_data) as f:
+                    geo_data = json.load(f)
+            else:
+                geo_data = json.loads(geo_data)
+
+        def round_coords(coords):
+            if isinstance(coords[0], (int, float)):
+                return [round(c, precision) for c in coords]
+            return [round_coords(c) for c in coords]
+
+        # Build new feature dicts rather than mutating in place: the
+        # input may come from the shared parse cache
+        keep = {key_on.split('.')[-1], 'NAME'}
+        features = []
+        for feature in geo_data.get('features', []):
+            props = {k: v for k, v in feature.get('properties', {}).items() if k in keep}
+            geometry = feature.get('geometry')
+            if geometry and geometry.get('coordinates'):
+                geometry = dict(geometry, coordinates=round_coords(geometry['coordinates']))
+            features.append(dict(feature, properties=props, geometry=geometry))
+
+        return dict(geo_data, features=features)
+
     def add_choropleth(self,
                       geo_data: Union[str, Dict],
                       data: pd.DataFrame,
@@ -39,9 +481,12 @@ class UnemploymentMap:
                       fill_opacity: float = 0.7,
                       line_opacity: float = 0.2,
                       legend_name: str = 'Unemployment Rate',
+                      compact_geometry: bool = False,
+                      simplify_tolerance: Optional[float] = None,
+                      inline_geojson: bool = True,
                       **kwargs) -> 'UnemploymentMap':
         """Add a choropleth layer to the map.
-        
+
         Args:
             geo_data: GeoJSON string, file path, or dict containing the geometries
             data: DataFrame containing the data to plot
@@ -51,18 +496,88 @@ class UnemploymentMap:
             fill_opacity: Opacity of the fill (0-1)
             line_opacity: Opacity of the boundary lines (0-1)
             legend_name: Title for the legend
+            compact_geometry: Round coordinates and prune unused
+                properties before embedding, shrinking the HTML payload
+            simplify_tolerance: Douglas-Peucker tolerance in degrees for
+                pre-simplifying polygon boundaries (0.001 suits county
+                overviews); None, the default, renders the geometry
+                untouched
+            inline_geojson: When False, save() writes the geometry to a
+                sidecar .geojson (and .geojson.gz) next to the HTML and
+                the page fetches it, instead of embedding it inline
+                (extra Choropleth kwargs are not forwarded on this path)
             **kwargs: Additional arguments to pass to folium.Choropleth
-            
+
         Returns:
             self for method chaining
         """
+        import folium
+
         # Create a unique name for the layer
         layer_name = f"Choropleth: {legend_name}"
-        
-        # Create a feature group for this layer
-        self.feature_groups[layer_name] = folium.FeatureGroup(name=layer_name, show=True)
-        
-        # Create the choropleth
+
+        # Parse geometry once up front — through the module-level caches,
+        # so repeated choropleths over the same boundaries skip the parse
+        # entirely. Non-JSON file paths stay as paths (they may be
+        # shapefiles for the simplify step).
+        if isinstance(geo_data, str):
+            if os.path.exists(geo_data):
+                if geo_data.endswith(('.json', '.geojson')):
+                    geo_data = _load_geojson_file(
+                        os.path.abspath(geo_data), os.path.getmtime(geo_data)
+                    )
+            elif geo_data.lstrip().startswith('{'):
+                geo_data = _parse_geojson_str(geo_data)
+
+        has_name_property = self._has_name_property(geo_data)
+
+        if simplify_tolerance:
+            geo_data = self._simplify_geo_data(geo_data, simplify_tolerance)
+
+        if compact_geometry:
+            geo_data = self._compact_geo_data(geo_data, key_on)
+
+        geo_repr = geo_data if isinstance(geo_data, str) else _json_dumps(geo_data, sort_keys=True)
+        self._update_content_hash(data, (
+            layer_name, columns, key_on, fill_color, fill_opacity,
+            line_opacity, geo_repr, inline_geojson, sorted(kwargs.items())
+        ))
+
+        if not inline_geojson:
+            # Load to a dict for the sidecar write at save time
+            if isinstance(geo_data, str):
+                if os.path.exists(geo_data):
+                    with open(geo_data) as f:
+                        geo_data = json.load(f)
+                else:
+                    geo_data = json.loads(geo_data)
+
+            # Resolve the data join to per-feature colors here, so only
+            # a small id-to-color map travels with the page
+            from branca.colormap import LinearColormap
+
+            id_col, value_col = columns
+            values = pd.to_numeric(data[value_col], errors='coerce')
+            colormap = LinearColormap(
+                ['#ffffb2', '#fecc5c', '#fd8d3c', '#f03b20', '#bd0026'],
+                vmin=float(values.min()), vmax=float(values.max())
+            )
+            color_by_id = {str(i): colormap(v)
+                           for i, v in zip(data[id_col], values) if pd.notna(v)}
+
+            layer = _macro_layers()['external_geojson'](
+                key_prop=key_on.split('.')[-1],
+                colors_json=_json_dumps(color_by_id),
+                fill_opacity=fill_opacity,
+                line_opacity=line_opacity
+            )
+            layer.add_to(self._register(layer_name, 'choropleth'))
+            self._pending_geojson.append((legend_name, geo_data, layer))
+            return self
+
+        # Create the choropleth in a registered feature group; dict
+        # geo_data goes through as-is — folium re-parses inline JSON
+        # strings, so pre-serializing would just add a decode round-trip
         choropleth = folium.Choropleth(
             geo_data=geo_data,
             data=data,
@@ -74,20 +589,18 @@ class UnemploymentMap:
             legend_name=legend_name,
             highlight=True,
             **kwargs
-        ).add_to(self.feature_groups[layer_name])
-        
-        # Add tooltip with data on hover
-        if 'feature.properties.NAME' in geo_data:
+        ).add_to(self._register(layer_name, 'choropleth'))
+
+        # Add tooltip with data on hover; only NAME is a feature
+        # property (the value column lives in the DataFrame, and folium
+        # asserts every field exists in the feature properties)
+        if has_name_property:
             folium.GeoJsonTooltip(
-                fields=['NAME', columns[1]],
-                aliases=['Location', legend_name],
+                fields=['NAME'],
+                aliases=['Location'],
                 style=('background-color: white; color: #333333; font-family: arial; font-size: 12px; padding: 2px;')
             ).add_to(choropleth.geojson)
-        
-        # Add the feature group to the map
-        self.feature_groups[layer_name].add_to(self.map)
-        self.layers[layer_name] = 'choropleth'
-        
+
         return self
     
     def add_heatmap(self,
@@ -99,9 +612,11 @@ class UnemploymentMap:
                    blur: int = 15,
                    max_zoom: int = 13,
                    name: str = 'Heatmap',
+                   binary_encoding: bool = False,
+                   quantize_weights: bool = True,
                    **kwargs) -> 'UnemploymentMap':
         """Add a heatmap layer to the map.
-        
+
         Args:
             data: DataFrame containing the data points
             latitude_col: Name of the latitude column
@@ -111,44 +626,236 @@ class UnemploymentMap:
             blur: Amount of blur
             max_zoom: The maximum zoom level for the heatmap
             name: Name for the layer
+            binary_encoding: Ship the points as a base64 float32 blob
+                decoded in the browser instead of a JSON array; much
+                smaller HTML for large heatmaps (extra HeatMap kwargs
+                are not forwarded on this path)
+            quantize_weights: Scale weights by their maximum and round
+                to 256 levels before shipping; see add_heatmap_arrays
             **kwargs: Additional arguments to pass to HeatMap
-            
+
+        Returns:
+            self for method chaining
+        """
+        weight = None
+        if weight_col:
+            weight = data[weight_col].to_numpy(dtype=np.float64)
+
+        return self.add_heatmap_arrays(
+            data[latitude_col].to_numpy(dtype=np.float64),
+            data[longitude_col].to_numpy(dtype=np.float64),
+            weight=weight,
+            radius=radius,
+            blur=blur,
+            max_zoom=max_zoom,
+            name=name,
+            binary_encoding=binary_encoding,
+            quantize_weights=quantize_weights,
+            **kwargs
+        )
+
+    def add_heatmap_arrays(self,
+                          lat: np.ndarray,
+                          lon: np.ndarray,
+                          weight: Optional[np.ndarray] = None,
+                          radius: int = 15,
+                          blur: int = 15,
+                          max_zoom: int = 13,
+                          name: str = 'Heatmap',
+                          binary_encoding: bool = False,
+                          quantize_weights: bool = True,
+                          **kwargs) -> 'UnemploymentMap':
+        """Add a heatmap layer from plain coordinate arrays.
+
+        Lower-level counterpart of add_heatmap for callers that already
+        hold NumPy arrays; skips the DataFrame column slicing entirely.
+
+        Args:
+            lat: Latitude values
+            lon: Longitude values
+            weight: Optional point weights
+            radius: Radius of each point in the heatmap
+            blur: Amount of blur
+            max_zoom: The maximum zoom level for the heatmap
+            name: Name for the layer
+            binary_encoding: Ship the points as a base64 float32 blob
+                decoded in the browser instead of a JSON array
+            quantize_weights: Scale weights by their maximum and round
+                to 256 levels before shipping. Much shorter JSON in the
+                [0, 1] range leaflet-heat expects, relative intensities
+                preserved, and the 1/256 step is invisible on a blurred
+                heatmap. Disable to send raw weights.
+            **kwargs: Additional arguments to pass to HeatMap
+
         Returns:
             self for method chaining
         """
         # Create a unique name for the layer
         layer_name = f"Heatmap: {name}"
-        
-        # Prepare the data
-        if weight_col:
-            heat_data = data[[latitude_col, longitude_col, weight_col]].values.tolist()
-            heat_data = [[x[0], x[1], float(x[2])] for x in heat_data]
-        else:
-            heat_data = data[[latitude_col, longitude_col]].values.tolist()
-        
-        # Create a feature group for this layer
-        self.feature_groups[layer_name] = folium.FeatureGroup(name=layer_name, show=True)
-        
-        # Add the heatmap to the feature group
+
+        arrays = [np.asarray(lat, dtype=np.float64), np.asarray(lon, dtype=np.float64)]
+        if weight is not None:
+            w = np.asarray(weight, dtype=np.float64)
+            if quantize_weights:
+                # Scale against the maximum only (leaflet-heat clips
+                # above 1 anyway) so relative intensities are preserved —
+                # min-max stretching would dramatize noise in a narrow
+                # band — and snap to 256 levels, rounded for short JSON
+                w_max = w.max()
+                if w_max > 0:
+                    w = w / w_max
+                w = np.round(np.round(w * 255) / 255, 3)
+            arrays.append(w)
+        points = np.column_stack(arrays)
+
+        # Drop points with missing coordinates before they reach the page
+        mask = self._finite_mask(points[:, 0], points[:, 1])
+        if not mask.all():
+            points = points[mask]
+
+        self._content_hash.update(points.tobytes())
+        self._content_hash.update(repr((
+            layer_name, radius, blur, max_zoom, binary_encoding, sorted(kwargs.items())
+        )).encode())
+
+        if binary_encoding:
+            _macro_layers()['binary_heat'](
+                encoded=base64.b64encode(points.astype(np.float32).tobytes()).decode('ascii'),
+                stride=points.shape[1],
+                radius=radius,
+                blur=blur,
+                max_zoom=max_zoom
+            ).add_to(self._register(layer_name, 'heatmap'))
+            return self
+
+        from folium.plugins import HeatMap
+
+        # Add the heatmap to a registered feature group
         HeatMap(
-            heat_data,
+            points.tolist(),
             radius=radius,
             blur=blur,
             max_zoom=max_zoom,
             **kwargs
-        ).add_to(self.feature_groups[layer_name])
-        
-        # Add the feature group to the map
-        self.feature_groups[layer_name].add_to(self.map)
-        self.layers[layer_name] = 'heatmap'
-        
+        ).add_to(self._register(layer_name, 'heatmap'))
+
         return self
     
+    @staticmethod
+    def _tile_points(lat: np.ndarray,
+                     lon: np.ndarray,
+                     popups: Optional[np.ndarray],
+                     tooltips: Optional[np.ndarray],
+                     tile_zoom: int) -> Dict[Tuple[int, int], list]:
+        """Bucket points into slippy-map tiles at a fixed zoom.
+
+        Vectorized tile-coordinate math plus one sort — a fixed-depth
+        quadtree partition without needing a spatial-index dependency.
+
+        Args:
+            lat: Latitude values (finite)
+            lon: Longitude values (finite)
+            popups: Optional per-point popup strings, aligned with lat
+            tooltips: Optional per-point tooltip strings, aligned with lat
+            tile_zoom: Zoom level of the tile grid
+
+        Returns:
+            Dict mapping (x, y) tile coordinates to point lists of
+            [lat, lon] or [lat, lon, popup, tooltip]
+        """
+        n = 1 << tile_zoom
+        xt = np.clip(((lon + 180.0) / 360.0 * n).astype(np.int64), 0, n - 1)
+        rad = np.radians(np.clip(lat, -85.0511, 85.0511))
+        yt = np.clip(
+            ((1 - np.arcsinh(np.tan(rad)) / np.pi) / 2 * n).astype(np.int64),
+            0, n - 1
+        )
+
+        order = np.argsort(xt * n + yt, kind='stable')
+        tiles: Dict[Tuple[int, int], list] = {}
+        with_labels = popups is not None or tooltips is not None
+        for i in order:
+            point = [round(float(lat[i]), 6), round(float(lon[i]), 6)]
+            if with_labels:
+                point.append(str(popups[i]) if popups is not None else None)
+                point.append(str(tooltips[i]) if tooltips is not None else None)
+            tiles.setdefault((int(xt[i]), int(yt[i])), []).append(point)
+        return tiles
+
+    @staticmethod
+    def _finite_mask(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        """Boolean mask of rows whose coordinates are both finite.
+
+        One vectorized pass shared by every layer builder, so no path
+        re-scans for missing coordinates row by row (or, in the
+        heatmap's case, ships unplottable points to the browser).
+        """
+        return np.isfinite(lat) & np.isfinite(lon)
+
+    @staticmethod
+    def _cluster_points(coords: np.ndarray, cell_size: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Aggregate points onto a lat/lon grid.
+
+        Quantizes each point to a grid cell and collapses every cell to
+        its centroid, all with vectorized numpy (unique + bincount), so
+        clustering is done once in Python instead of in the browser.
+
+        Args:
+            coords: (N, 2) array of [latitude, longitude] rows
+            cell_size: Grid cell size in degrees
+
+        Returns:
+            Tuple of ((M, 2) centroid array, (M,) per-cell point counts)
+        """
+        cells = np.floor(coords / cell_size).astype(np.int64)
+        # Single sortable key per cell; longitudes span < 2**32 cells
+        keys = cells[:, 0] * (1 << 32) + cells[:, 1]
+        _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        centroids = np.empty((counts.size, 2), dtype=np.float64)
+        centroids[:, 0] = np.bincount(inverse, weights=coords[:, 0]) / counts
+        centroids[:, 1] = np.bincount(inverse, weights=coords[:, 1]) / counts
+        return centroids, counts
+
+    @staticmethod
+    def _render_popup_template(data: pd.DataFrame, template: str) -> np.ndarray:
+        """Render a format-style template once per row, vectorized.
+
+        Templates whose placeholders are plain column names are built by
+        concatenating string Series — one C-level pass per fragment
+        instead of N Python format calls. Placeholders with a format
+        spec or conversion fall back to per-row str.format.
+
+        Args:
+            data: DataFrame whose columns fill the placeholders
+            template: Template string, e.g. "County: {NAME}, Rate: {rate}%"
+
+        Returns:
+            np.ndarray of rendered strings aligned with data's rows
+        """
+        import string
+
+        pieces = list(string.Formatter().parse(template))
+        plain = all(field and spec in (None, '') and conv is None
+                    for _literal, field, spec, conv in pieces if field is not None)
+        if plain:
+            result = pd.Series('', index=data.index)
+            for literal, field, _spec, _conv in pieces:
+                if literal:
+                    result = result + literal
+                if field is not None:
+                    result = result + data[field].astype(str)
+            return result.to_numpy()
+
+        return data.apply(
+            lambda row: template.format(**row), axis=1
+        ).astype(str).to_numpy()
+
     def add_circle_markers(self,
                          data: pd.DataFrame,
                          latitude_col: str = 'latitude',
                          longitude_col: str = 'longitude',
                          popup_col: Optional[str] = None,
+                         popup_template: Optional[str] = None,
                          tooltip_col: Optional[str] = None,
                          radius: int = 5,
                          color: str = '#3186cc',
@@ -157,14 +864,23 @@ class UnemploymentMap:
                          fill_opacity: float = 0.7,
                          weight: int = 1,
                          name: str = 'Markers',
+                         cluster_threshold: int = 2000,
+                         cluster_cell_size: float = 1.0,
+                         tiled: bool = False,
+                         tile_zoom: int = 8,
                          **kwargs) -> 'UnemploymentMap':
         """Add circle markers to the map.
-        
+
         Args:
             data: DataFrame containing the data points
             latitude_col: Name of the latitude column
             longitude_col: Name of the longitude column
             popup_col: Name of the column to use for popups
+            popup_template: Format-style template rendered against row
+                columns, e.g. "County: {NAME}, Rate: {rate}%"; takes
+                precedence over popup_col. Plain {field} placeholders
+                are filled with vectorized string concatenation; format
+                specs fall back to a per-row format call
             tooltip_col: Name of the column to use for tooltips
             radius: Radius of the markers in pixels
             color: Stroke color
@@ -173,55 +889,257 @@ class UnemploymentMap:
             fill_opacity: Fill opacity (0-1)
             weight: Stroke width in pixels
             name: Name for the layer
+            cluster_threshold: Above this many points, pre-cluster in
+                Python and draw one marker per grid cell instead of one
+                per row
+            cluster_cell_size: Grid cell size in degrees for pre-clustering
+            tiled: Load markers lazily from per-tile JSON sidecars
+                written at save time; see add_circle_markers_arrays
+            tile_zoom: Slippy-map zoom level of the tile grid
             **kwargs: Additional arguments to pass to CircleMarker
-            
+
+        Returns:
+            self for method chaining
+        """
+        popups = None
+        if popup_template:
+            popups = self._render_popup_template(data, popup_template)
+        elif popup_col and popup_col in data.columns:
+            popups = data[popup_col].astype(str).to_numpy()
+
+        tooltips = None
+        if tooltip_col and tooltip_col in data.columns:
+            tooltips = data[tooltip_col].astype(str).to_numpy()
+
+        return self.add_circle_markers_arrays(
+            data[latitude_col].to_numpy(dtype=np.float64),
+            data[longitude_col].to_numpy(dtype=np.float64),
+            popups=popups,
+            tooltips=tooltips,
+            radius=radius,
+            color=color,
+            fill=fill,
+            fill_color=fill_color,
+            fill_opacity=fill_opacity,
+            weight=weight,
+            name=name,
+            cluster_threshold=cluster_threshold,
+            cluster_cell_size=cluster_cell_size,
+            tiled=tiled,
+            tile_zoom=tile_zoom,
+            **kwargs
+        )
+
+    def add_circle_markers_arrays(self,
+                                 lat: np.ndarray,
+                                 lon: np.ndarray,
+                                 popups: Optional[np.ndarray] = None,
+                                 tooltips: Optional[np.ndarray] = None,
+                                 radius: int = 5,
+                                 color: str = '#3186cc',
+                                 fill: bool = True,
+                                 fill_color: Optional[str] = None,
+                                 fill_opacity: float = 0.7,
+                                 weight: int = 1,
+                                 name: str = 'Markers',
+                                 cluster_threshold: int = 2000,
+                                 cluster_cell_size: float = 1.0,
+                                 tiled: bool = False,
+                                 tile_zoom: int = 8,
+                                 **kwargs) -> 'UnemploymentMap':
+        """Add circle markers from plain coordinate arrays.
+
+        Lower-level counterpart of add_circle_markers for callers that
+        already hold NumPy arrays; skips DataFrame slicing entirely.
+
+        Args:
+            lat: Latitude values
+            lon: Longitude values
+            popups: Optional per-point popup strings
+            tooltips: Optional per-point tooltip strings
+            radius: Radius of the markers in pixels
+            color: Stroke color
+            fill: Whether to fill the markers
+            fill_color: Fill color (defaults to stroke color if None)
+            fill_opacity: Fill opacity (0-1)
+            weight: Stroke width in pixels
+            name: Name for the layer
+            cluster_threshold: Above this many points, pre-cluster in
+                Python and draw one marker per grid cell instead of one
+                per row
+            cluster_cell_size: Grid cell size in degrees for pre-clustering
+            tiled: Write the points as per-tile JSON sidecars at save
+                time and fetch only the tiles covering the viewport;
+                nothing but the loader ships with the page. Overrides
+                the clustering paths.
+            tile_zoom: Slippy-map zoom level of the tile grid
+            **kwargs: Additional arguments to pass to CircleMarker
+
         Returns:
             self for method chaining
         """
         # Create a unique name for the layer
         layer_name = f"Markers: {name}"
-        
-        # Create a feature group for this layer
-        self.feature_groups[layer_name] = folium.FeatureGroup(name=layer_name, show=True)
-        
-        # Create a marker cluster
-        marker_cluster = MarkerCluster().add_to(self.feature_groups[layer_name])
-        
+
+        import folium
+        from folium.plugins import MarkerCluster
+
+        # Drop rows with missing coordinates in a single vectorized
+        # mask, so the loops below only build folium objects
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        valid = self._finite_mask(lat, lon)
+
+        self._content_hash.update(lat.tobytes())
+        self._content_hash.update(lon.tobytes())
+        for labels in (popups, tooltips):
+            if labels is not None:
+                self._content_hash.update(np.asarray(labels, dtype=str).tobytes())
+        self._content_hash.update(repr((
+            layer_name, radius, color, fill, fill_color, fill_opacity, weight,
+            cluster_threshold, cluster_cell_size, tiled, tile_zoom,
+            sorted(kwargs.items())
+        )).encode())
+
+        if tiled:
+            if popups is not None:
+                popups = np.asarray(popups, dtype=str)[valid]
+            if tooltips is not None:
+                tooltips = np.asarray(tooltips, dtype=str)[valid]
+            options = {
+                'radius': radius, 'color': color, 'fill': fill,
+                'fillColor': fill_color or color,
+                'fillOpacity': fill_opacity, 'weight': weight,
+            }
+            tiles = self._tile_points(lat[valid], lon[valid], popups, tooltips, tile_zoom)
+            layer = _macro_layers()['tiled_markers'](
+                tile_zoom=tile_zoom, options_json=_json_dumps(options)
+            )
+            layer.add_to(self._register(layer_name, 'markers'))
+            safe = ''.join(c if c.isalnum() else '_' for c in name.lower())
+            self._pending_marker_tiles.append((safe, tile_zoom, tiles, layer))
+            return self
+
+        # For large inputs, cluster server-side: emitting one marker per
+        # grid-cell centroid keeps the HTML payload to a few hundred
+        # nodes instead of N, and the browser no longer re-clusters on
+        # every zoom
+        if valid.sum() > cluster_threshold:
+            group = self._register(layer_name, 'markers')
+            coords = np.column_stack((lat, lon))[valid]
+            centroids, counts = self._cluster_points(coords, cluster_cell_size)
+            scale = radius / np.sqrt(counts.min())
+            for (clat, clon), count in zip(centroids, counts):
+                folium.CircleMarker(
+                    location=[clat, clon],
+                    radius=float(min(scale * np.sqrt(count), radius * 6)),
+                    color=color,
+                    fill=fill,
+                    fill_color=fill_color or color,
+                    fill_opacity=fill_opacity,
+                    weight=weight,
+                    tooltip=f"{count} points",
+                    **kwargs
+                ).add_to(group)
+
+            return self
+
+        if popups is not None:
+            popups = np.asarray(popups, dtype=str)[valid]
+        if tooltips is not None:
+            tooltips = np.asarray(tooltips, dtype=str)[valid]
+
+        # All markers share their styling, so skip the per-marker jinja2
+        # render folium would do and format the JS lines directly; the
+        # CircleMarker fallback below only runs for custom kwargs
+        if not kwargs:
+            options = _json_dumps({
+                'radius': radius, 'color': color, 'fill': fill,
+                'fillColor': fill_color or color,
+                'fillOpacity': fill_opacity, 'weight': weight,
+            })
+            lines = []
+            lat_v = lat[valid]
+            lon_v = lon[valid]
+            for i in range(lat_v.size):
+                marker = f"L.circleMarker([{lat_v[i]:.6f},{lon_v[i]:.6f}],{options})"
+                if popups is not None:
+                    marker += f".bindPopup({json.dumps(str(popups[i]))})"
+                if tooltips is not None:
+                    marker += f".bindTooltip({json.dumps(str(tooltips[i]))})"
+                lines.append(marker + ".addTo(cluster);")
+            _macro_layers()['bulk_markers']("\n            ".join(lines)) \
+                .add_to(self._register(layer_name, 'markers'))
+            return self
+
+        # Create a marker cluster inside a registered feature group
+        marker_cluster = MarkerCluster().add_to(self._register(layer_name, 'markers'))
+
         # Add each marker
-        for _, row in data.iterrows():
-            if pd.isna(row[latitude_col]) or pd.isna(row[longitude_col]):
-                continue
-                
-            # Create popup if specified
-            popup = None
-            if popup_col and popup_col in row:
-                popup = str(row[popup_col])
-            
-            # Create tooltip if specified
-            tooltip = None
-            if tooltip_col and tooltip_col in row:
-                tooltip = str(row[tooltip_col])
-            
-            # Create the marker
+        for i, (mlat, mlon) in enumerate(zip(lat[valid], lon[valid])):
             folium.CircleMarker(
-                location=[row[latitude_col], row[longitude_col]],
+                location=[mlat, mlon],
                 radius=radius,
                 color=color,
                 fill=fill,
                 fill_color=fill_color or color,
                 fill_opacity=fill_opacity,
                 weight=weight,
-                popup=popup,
-                tooltip=tooltip,
+                popup=popups[i] if popups is not None else None,
+                tooltip=tooltips[i] if tooltips is not None else None,
                 **kwargs
             ).add_to(marker_cluster)
-        
-        # Add the feature group to the map
-        self.feature_groups[layer_name].add_to(self.map)
-        self.layers[layer_name] = 'markers'
-        
+
         return self
     
+    def _build_one(self, spec: Dict[str, Any]) -> 'UnemploymentMap':
+        """Build a single layer spec on a scratch map (thread worker)."""
+        spec = dict(spec)
+        kind = spec.pop('kind')
+        scratch = UnemploymentMap()
+        try:
+            method = {
+                'choropleth': scratch.add_choropleth,
+                'heatmap': scratch.add_heatmap,
+                'markers': scratch.add_circle_markers,
+            }[kind]
+        except KeyError:
+            raise ValueError(f"Unknown layer kind: {kind!r}")
+        method(**spec)
+        return scratch
+
+    def build_layers(self, specs: List[Dict[str, Any]]) -> 'UnemploymentMap':
+        """Build several layers concurrently and attach them in order.
+
+        Each spec is the kwargs of one add_* call plus a 'kind' key
+        ('choropleth', 'heatmap', or 'markers'). Layers are constructed
+        independently on a thread pool — GeoJSON parsing and the NumPy
+        work release the GIL — and only attached to the shared map on
+        the calling thread, so results are deterministic regardless of
+        completion order.
+
+        Args:
+            specs: List of layer specs, e.g.
+                [{'kind': 'heatmap', 'data': df, 'weight_col': 'value'}]
+
+        Returns:
+            self for method chaining
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor() as executor:
+            built = list(executor.map(self._build_one, specs))
+
+        for scratch in built:
+            for layer_name, kind, group in scratch._layers:
+                group.add_to(self.map)
+                self._layers.append((layer_name, kind, group))
+            self._pending_geojson.extend(scratch._pending_geojson)
+            self._pending_marker_tiles.extend(scratch._pending_marker_tiles)
+            self._content_hash.update(scratch._content_hash.digest())
+
+        return self
+
     def add_layers_control(self, position: str = 'topright') -> 'UnemploymentMap':
         """Add a layers control to the map.
         
@@ -231,7 +1149,9 @@ class UnemploymentMap:
         Returns:
             self for method chaining
         """
-        if self.feature_groups:
+        import folium
+
+        if self._layers:
             folium.LayerControl(
                 position=position,
                 collapsed=False
@@ -264,9 +1184,12 @@ class UnemploymentMap:
             </div>
         '''
         
+        import folium
+
         self.map.get_root().html.add_child(folium.Element(title_html))
+        self._update_content_hash(None, ('title', title, position))
         return self
-    
+
     def add_legend(self, title: str, colors: List[str], labels: List[str], 
                   position: str = 'bottomright') -> 'UnemploymentMap':
         """Add a legend to the map.
@@ -283,11 +1206,12 @@ class UnemploymentMap:
         if len(colors) != len(labels):
             raise ValueError("Number of colors must match number of labels")
         
-        # Create the HTML for the legend
-        legend_html = f'''
-            <div style="position: fixed; 
-                        {position}: 10px; 
-                        z-index:1000; 
+        # Create the HTML for the legend; collect the pieces and join
+        # once rather than concatenating in the loop
+        parts = [f'''
+            <div style="position: fixed;
+                        {position}: 10px;
+                        z-index:1000;
                         background-color: rgba(255, 255, 255, 0.8);
                         padding: 10px;
                         border-radius: 5px;
@@ -297,45 +1221,89 @@ class UnemploymentMap:
                 <div style="font-weight: bold; margin-bottom: 5px; text-align: center;">
                     {title}
                 </div>
-        '''
-        
+        ''']
+
         for color, label in zip(colors, labels):
-            legend_html += f'''
+            parts.append(f'''
                 <div style="margin: 2px 0;">
-                    <i style="background:{color}; width: 12px; height: 12px; 
+                    <i style="background:{color}; width: 12px; height: 12px;
                             display: inline-block; margin-right: 5px;"></i>
                     {label}
                 </div>
-            '''
-        
-        legend_html += "</div>"
+            ''')
+
+        parts.append("</div>")
+        legend_html = "".join(parts)
         
+        import folium
+
         self.map.get_root().html.add_child(folium.Element(legend_html))
+        self._update_content_hash(None, ('legend', title, tuple(colors), tuple(labels), position))
         return self
-    
-    def save(self, filepath: str) -> None:
+
+    def save(self, filepath: str, use_cache: bool = False) -> None:
         """Save the map to an HTML file.
-        
+
         Args:
             filepath: Path to save the HTML file
+            use_cache: Reuse (and populate) a cached render keyed by the
+                map's data and styling, skipping folium serialization
+                when an identical map was saved before
         """
-        # Ensure the directory exists
-        os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
-        
+        # Ensure the directory exists; dashboards re-save into the same
+        # folder on every refresh, so remember directories already made
+        out_dir = os.path.dirname(os.path.abspath(filepath))
+        if out_dir not in self._ensured_dirs:
+            os.makedirs(out_dir, exist_ok=True)
+            self._ensured_dirs.add(out_dir)
+
+        # Write any non-inline geometry as sidecar files the page fetches;
+        # the .gz twin lets a static server send the precompressed copy
+        base = os.path.splitext(os.path.abspath(filepath))[0]
+        for suffix, geo_dict, layer in self._pending_geojson:
+            safe = ''.join(c if c.isalnum() else '_' for c in suffix.lower())
+            geo_path = f"{base}_{safe}.geojson"
+            payload = _json_dumps(geo_dict)
+            with open(geo_path, 'w') as f:
+                f.write(payload)
+            with gzip.open(f"{geo_path}.gz", 'wt') as f:
+                f.write(payload)
+            layer.url = os.path.basename(geo_path)
+
+        # Write tiled marker layers as one JSON file per slippy tile
+        for safe, tile_zoom, tiles, layer in self._pending_marker_tiles:
+            tiles_dir = f"{base}_{safe}_tiles"
+            for (x, y), points in tiles.items():
+                tile_dir = os.path.join(tiles_dir, str(tile_zoom), str(x))
+                os.makedirs(tile_dir, exist_ok=True)
+                with open(os.path.join(tile_dir, f"{y}.json"), 'w') as f:
+                    f.write(_json_dumps(points))
+            layer.base_url = os.path.basename(tiles_dir)
+
         # Add layer control if we have multiple layers
-        if len(self.feature_groups) > 1:
+        if len(self._layers) > 1:
             self.add_layers_control()
-        
-        # Save the map
-        self.map.save(filepath)
+
+        if use_cache:
+            cache_path = self._cache_path(self.cache_key)
+            if os.path.exists(cache_path):
+                shutil.copyfile(cache_path, filepath)
+                print(f"Map restored from cache to {filepath}")
+                return
+            self.map.save(filepath)
+            shutil.copyfile(filepath, cache_path)
+        else:
+            self.map.save(filepath)
         print(f"Map saved to {filepath}")
     
     def _repr_html_(self) -> str:
         """Display the map in Jupyter notebooks."""
+        import folium
+
         if self.map._parent is None:
             self.map.add_to(folium.Figure())
         return self.map._parent._repr_html_()
-    
-    def show(self) -> folium.Map:
+
+    def show(self) -> 'folium.Map':
         """Display the map in Jupyter notebooks."""
         return self.map
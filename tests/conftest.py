@@ -3,14 +3,23 @@ import os
 import sys
 from pathlib import Path
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Make the package importable from a clean checkout (no editable
+# install needed): the source lives under src/
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Set once per process: pytest_configure re-runs in every xdist worker,
+# and the mkdir syscall is redundant after the first session
+_data_dir_ready = False
+
 
 def pytest_configure(config):
     """Configure pytest with custom settings."""
     # Set environment variables for testing
     os.environ["ENV"] = "test"
-    
-    # Create test data directory
-    test_data_dir = Path("tests/data")
-    test_data_dir.mkdir(exist_ok=True)
+
+    # Create the test data directory next to this file, independent of
+    # the invocation directory
+    global _data_dir_ready
+    if not _data_dir_ready:
+        (Path(__file__).parent / "data").mkdir(parents=True, exist_ok=True)
+        _data_dir_ready = True